@@ -12,108 +12,249 @@ ctypes.windll.user32.SetProcessDPIAware()
 # Start game and initial setting
 pygame.init()
 
-# Constants to indicate which kind of input
-LCLICK = 1      # Left click (bool)
-MCLICK = 2      # Middle click (bool)
-RCLICK = 3      # Right click (bool)
-SCRLUP = 4      # Scroll up (bool)
-SCRLDN = 5      # Scroll down (bool)
-CURPOS = 6      # Cursor position (tuple (x, y))
-
-# Defining colors
+# Defining colors (only the ones used in this game)
 BLACK = (0, 0, 0)
 WHITE1 = (255, 255, 255)
 WHITE2 = (127, 127, 127)
 WHITE3 = (63, 63, 63)
 RED1 = (255, 63, 63)
-RED2 = (127, 31, 31)
-RED3 = (63, 15, 15)
-GREEN1 = (0, 255, 0)
-GREEN2 = (0, 127, 0)
-GREEN3 = (0, 63, 0)
-BLUE1 = (63, 191, 255)
-BLUE2 = (31, 95, 127)
-BLUE3 = (15, 47, 63)
-CYAN1 = (0, 255, 255)
-CYAN2 = (0, 127, 127)
-CYAN3 = (0, 63, 63)
-MAGENTA1 = (255, 0, 255)
-MAGENTA2 = (127, 0, 127)
-MAGENTA3 = (63, 0, 63)
 YELLOW1 = (255, 255, 0)
-YELLOW2 = (127, 127, 0)
-YELLOW3 = (63, 63, 0)
-ORANGE1 = (255, 102, 0)
-ORANGE2 = (127, 51, 0)
-ORANGE3 = (63, 25, 0)
-PURPLE1 = (191, 95, 255)
-PURPLE2 = (95, 47, 127)
-PURPLE3 = (47, 23, 63)
 
 # Set game title
 pygame.display.set_caption("Arc Tracker")
 
 # Create the screen
 screen_width, screen_height = 1920, 1080
-flags = FULLSCREEN | DOUBLEBUF
-screen = pygame.display.set_mode((screen_width, screen_height), flags, 16)
+flags = SCALED | FULLSCREEN     # Present through SDL renderer (GPU-accelerated scaling)
+screen = pygame.display.set_mode((screen_width, screen_height), flags, vsync=0)    # Frame rate is capped by the game loop only
+
+# Queue only input events handled by the game loop, so that no event objects are created for others
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([QUIT, MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, KEYDOWN, KEYUP])
 
 # Frame control
 FPS = 60
-fps_clock = pygame.time.Clock()
+FRAME_TIME = 1 / FPS    # Target duration of a frame in seconds
+SPIN_TIME = 0.001       # Last part of each frame waited by busy loop instead of sleeping (in seconds)
 DELTA_TIME = 0
+IDLE_WAIT_TIME = 100    # Maximum time to wait for input on menu screens (in milliseconds)
+
+
+
+class MouseState:
+    """
+    Clicking event and cursor position info of mouse in current frame
+    """
+
+    __slots__ = ("lclick", "mclick", "rclick", "scrlup", "scrldn", "curpos")
+
+    def __init__(self):
+        """
+        Initializing method
+        """
+
+        self.lclick = False     # Left click (bool)
+        self.mclick = False     # Middle click (bool)
+        self.rclick = False     # Right click (bool)
+        self.scrlup = False     # Scroll up (bool)
+        self.scrldn = False     # Scroll down (bool)
+        self.curpos = (0, 0)    # Cursor position (tuple (x, y))
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """
+        Apply a mouse event to this state
 
-# Mouse control event dict
-mouse = {LCLICK: False, MCLICK: False, RCLICK: False, SCRLUP: False, SCRLDN: False, CURPOS: (0, 0)}
+        Buttons keep their pressed state between events, so only changes need to be written.
+
+        :param event: Event from pygame event queue
+        :return: None
+        """
+
+        if event.type == MOUSEMOTION:
+            self.curpos = event.pos
+        elif event.type == MOUSEBUTTONDOWN or event.type == MOUSEBUTTONUP:
+            pressed = event.type == MOUSEBUTTONDOWN
+            self.curpos = event.pos
+            if event.button == BUTTON_LEFT:
+                self.lclick = pressed
+            elif event.button == BUTTON_MIDDLE:
+                self.mclick = pressed
+            elif event.button == BUTTON_RIGHT:
+                self.rclick = pressed
+            elif event.button == BUTTON_X1:
+                self.scrlup = pressed
+            elif event.button == BUTTON_X2:
+                self.scrldn = pressed
+
+
+# Mouse control event state
+mouse = MouseState()
 
 # Indicates whether continue game
 running = True
 
 
+# Cache of all loaded images (keys: image path, values: converted image surface)
+image_cache = {}
+
+
+def load_image(path: str, colorkey=BLACK) -> pygame.Surface:
+    """
+    Load an image, convert it to the display format and remove its colorkey region
+
+    Each image file is decoded only once. Loading the same path again returns the cached surface.
+
+    :param path: path of the image file
+    :param colorkey: color to be transparent, default value is black(0, 0, 0)
+    :return: loaded image surface
+    """
+
+    image = image_cache.get(path)
+    if image is None:
+        image = pygame.image.load(path).convert()
+        image.set_colorkey(colorkey, RLEACCEL)     # Run-length encoding lets blits skip transparent pixels in runs
+        image_cache[path] = image
+
+    return image
+
+
+# Cache of all scaled images (keys: tuple of original image and size, values: scaled image surface)
+scaled_image_cache = {}
+
+
+def scale_image(image: pygame.Surface, size: (int, int)) -> pygame.Surface:
+    """
+    Scale an image to given size
+
+    Each image is scaled only once for each size. Scaling the same image to the same size again returns the cached surface.
+
+    :param image: original image surface
+    :param size: size of the scaled image
+    :return: scaled image surface
+    """
+
+    key = (image, size)
+    scaled_image = scaled_image_cache.get(key)
+    if scaled_image is None:
+        scaled_image = pygame.transform.scale(image, size)
+        if image.get_colorkey() is not None:
+            scaled_image.set_colorkey(image.get_colorkey(), RLEACCEL)
+        scaled_image_cache[key] = scaled_image
+
+    return scaled_image
+
+
+# Cache of collision masks of shared images (keys: image surface, values: mask object)
+mask_cache = {}
+
+
+def get_mask(image: pygame.Surface) -> pygame.mask.Mask:
+    """
+    Returns collision mask of an image
+
+    Mask of each image is created only once, so sprites sharing the same image also share its mask.
+    The image must not be modified after its mask is created.
+
+    :param image: image surface
+    :return: mask object of the image
+    """
+
+    mask = mask_cache.get(image)
+    if mask is None:
+        mask = pygame.mask.from_surface(image)
+        mask_cache[image] = mask
+
+    return mask
+
+
+# Cache of all created fonts (keys: tuple of font name and size, values: font object)
+font_cache = {}
+
+
+def get_font(name: str, size: int) -> pygame.font.Font:
+    """
+    Returns system font of given name and size
+
+    Font file is opened and parsed only once for each pair of name and size,
+    so all texts and buttons using the same font share a single font object.
+
+    :param name: name of system font
+    :param size: font size in pixels
+    :return: font object
+    """
+
+    key = (name, size)
+    font = font_cache.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size)
+        font_cache[key] = font
+
+    return font
+
+
+# Cache of all rendered texts (keys: tuple of font object, text and color, values: text surface)
+text_cache = {}
+
+
+def render_text(font: pygame.font.Font, text: str, color: (int, int, int)) -> pygame.Surface:
+    """
+    Render an antialiased text with given font and color
+
+    Each text is rendered only once for each font and color. Rendering it again returns the cached surface,
+    so the returned surface must not be modified.
+
+    :param font: font object (from get_font)
+    :param text: text to render
+    :param color: color of text
+    :return: rendered text surface
+    """
+
+    key = (font, text, color)
+    text_surface = text_cache.get(key)
+    if text_surface is None:
+        text_surface = font.render(text, True, color)
+        text_cache[key] = text_surface
+
+    return text_surface
+
+
 # Loading images
-arc_tracker_img1 = pygame.image.load("img/character/arc_tracker_1.png").convert()   # Image of Arc tracker (green)
-arc_tracker_img1.set_colorkey(BLACK)                                                # Remove black region of the image
-arc_tracker_img2 = pygame.image.load("img/character/arc_tracker_2.png").convert()   # Image of Arc tracker (blue)
-arc_tracker_img2.set_colorkey(BLACK)                                                # Remove black region of the image
-arc_tracker_img3 = pygame.image.load("img/character/arc_tracker_3.png").convert()   # Image of Arc tracker (red)
-arc_tracker_img3.set_colorkey(BLACK)                                                # Remove black region of the image
-arc_tracker_img_list = [arc_tracker_img1, arc_tracker_img2, arc_tracker_img3]       # List of all ArcTracker images
-
-arc_tracker_clone_img1 = pygame.image.load("img/character/arc_tracker_1_clone.png").convert()           # Image of Arc tracker clone (green)
-arc_tracker_clone_img1.set_colorkey(BLACK)                                                              # Remove black region of the image
-arc_tracker_clone_img2 = pygame.image.load("img/character/arc_tracker_2_clone.png").convert()           # Image of Arc tracker clone (blue)
-arc_tracker_clone_img2.set_colorkey(BLACK)                                                              # Remove black region of the image
-arc_tracker_clone_img3 = pygame.image.load("img/character/arc_tracker_3_clone.png").convert()           # Image of Arc tracker clone (red)
-arc_tracker_clone_img3.set_colorkey(BLACK)                                                              # Remove black region of the image
-arc_tracker_clone_img_list = [arc_tracker_clone_img1, arc_tracker_clone_img2, arc_tracker_clone_img3]   # List of all ArcTrackerClone images
-
-arc_tracker_counter_clone_img1 = pygame.image.load("img/character/arc_tracker_1_counter_clone.png").convert()                           # Image of Arc tracker_counter clone (green)
-arc_tracker_counter_clone_img1.set_colorkey(BLACK)                                                                                      # Remove black region of the image
-arc_tracker_counter_clone_img2 = pygame.image.load("img/character/arc_tracker_2_counter_clone.png").convert()                           # Image of Arc tracker_counter clone (blue)
-arc_tracker_counter_clone_img2.set_colorkey(BLACK)                                                                                      # Remove black region of the image
-arc_tracker_counter_clone_img3 = pygame.image.load("img/character/arc_tracker_3_counter_clone.png").convert()                           # Image of Arc tracker_counter clone (red)
-arc_tracker_counter_clone_img3.set_colorkey(BLACK)                                                                                      # Remove black region of the image
-arc_tracker_counter_clone_img_list = [arc_tracker_counter_clone_img1, arc_tracker_counter_clone_img2, arc_tracker_counter_clone_img3]   # List of all ArcTrackerClone images
-
-axis_marker_O_img = pygame.image.load("img/character/axis_marker_O.png").convert()  # O-shaped image of axis marker
-axis_marker_O_img.set_colorkey(BLACK)
-axis_marker_X_img = pygame.image.load("img/character/axis_marker_X.png").convert()  # O-shaped image of axis marker
-axis_marker_X_img.set_colorkey(BLACK)
-
-goal_point_img_list = []        # List of frame for animating GoalPoint
-for i in range(60):             # Load and append all frames to the list
-    img_frame = pygame.image.load(f"img/character/goal_point_anim/goal_point_{i}.png").convert()
-    img_frame.set_colorkey(BLACK)
-    goal_point_img_list.append(img_frame)
-
-example_game_img1 = pygame.image.load("img/example_play_capture/example_1.png").convert()
-example_game_img1.set_colorkey(BLACK)
-example_game_img2 = pygame.image.load("img/example_play_capture/example_2.png").convert()
-example_game_img2.set_colorkey(BLACK)
-example_game_img3 = pygame.image.load("img/example_play_capture/example_3.png").convert()
-example_game_img3.set_colorkey(BLACK)
-example_game_img4 = pygame.image.load("img/example_play_capture/example_4.png").convert()
-example_game_img4.set_colorkey(BLACK)
-
-# Load all obstacle images
-test_img_1 = pygame.image.load("img/obstacles/test/10-1.png").convert()       # Image for newly testing obstacle
+arc_tracker_img1 = load_image("img/character/arc_tracker_1.png")     # Image of Arc tracker (green)
+arc_tracker_img2 = load_image("img/character/arc_tracker_2.png")     # Image of Arc tracker (blue)
+arc_tracker_img3 = load_image("img/character/arc_tracker_3.png")     # Image of Arc tracker (red)
+arc_tracker_img_list = (arc_tracker_img1, arc_tracker_img2, arc_tracker_img3)       # Tuple of all ArcTracker images
+
+arc_tracker_clone_img1 = load_image("img/character/arc_tracker_1_clone.png")     # Image of Arc tracker clone (green)
+arc_tracker_clone_img2 = load_image("img/character/arc_tracker_2_clone.png")     # Image of Arc tracker clone (blue)
+arc_tracker_clone_img3 = load_image("img/character/arc_tracker_3_clone.png")     # Image of Arc tracker clone (red)
+arc_tracker_clone_img_list = (arc_tracker_clone_img1, arc_tracker_clone_img2, arc_tracker_clone_img3)   # Tuple of all ArcTrackerClone images
+
+arc_tracker_counter_clone_img1 = load_image("img/character/arc_tracker_1_counter_clone.png")     # Image of Arc tracker_counter clone (green)
+arc_tracker_counter_clone_img2 = load_image("img/character/arc_tracker_2_counter_clone.png")     # Image of Arc tracker_counter clone (blue)
+arc_tracker_counter_clone_img3 = load_image("img/character/arc_tracker_3_counter_clone.png")     # Image of Arc tracker_counter clone (red)
+arc_tracker_counter_clone_img_list = (arc_tracker_counter_clone_img1, arc_tracker_counter_clone_img2, arc_tracker_counter_clone_img3)   # Tuple of all ArcTrackerClone images
+
+axis_marker_O_img = load_image("img/character/axis_marker_O.png")   # O-shaped image of axis marker
+axis_marker_X_img = load_image("img/character/axis_marker_X.png")   # O-shaped image of axis marker
+axis_marker_img_list = (axis_marker_O_img, axis_marker_X_img)       # Tuple of all axis marker images
+
+# Compose all frames for animating GoalPoint side by side into a single per-pixel alpha surface (atlas)
+goal_point_frame_cnt = 60
+goal_point_frame_w, goal_point_frame_h = load_image("img/character/goal_point_anim/goal_point_0.png").get_size()
+goal_point_atlas = pygame.Surface((goal_point_frame_w * goal_point_frame_cnt, goal_point_frame_h), SRCALPHA).convert_alpha()
+for i in range(goal_point_frame_cnt):
+    # Colorkeyed black region of each frame remains transparent in the atlas
+    goal_point_atlas.blit(load_image(f"img/character/goal_point_anim/goal_point_{i}.png"), (i * goal_point_frame_w, 0))
+
+# List of frame for animating GoalPoint (each frame shares its pixels with the atlas)
+goal_point_img_list = tuple(goal_point_atlas.subsurface((i * goal_point_frame_w, 0, goal_point_frame_w, goal_point_frame_h))
+                            for i in range(goal_point_frame_cnt))
+
+# Paths of images which are loaded by load_image only when they are actually needed
+example_game_img_path1 = "img/example_play_capture/example_1.png"
+example_game_img_path2 = "img/example_play_capture/example_2.png"
+example_game_img_path3 = "img/example_play_capture/example_3.png"
+example_game_img_path4 = "img/example_play_capture/example_4.png"
+
+# Paths of all obstacle images
+test_img_path_1 = "img/obstacles/test/10-1.png"     # Image for newly testing obstacle
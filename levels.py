@@ -8,6 +8,13 @@ import pygame.sprite
 from sprites_and_functions import *
 
 
+# Distances within which ArcTracker collects a coin and locks onto a goal point
+coin_collect_radius = 20
+goal_lock_radius = 10
+coin_collect_radius_sq = coin_collect_radius ** 2     # Squared radii compared with squared distances
+goal_lock_radius_sq = goal_lock_radius ** 2
+
+
 class Level:
     """
     A single level class which ArcTracker should clear
@@ -17,6 +24,16 @@ class Level:
     such as level number, minimum moves to clear, playtime, etc..
     """
 
+    __slots__ = ("arctracker_list", "arctracker_group", "coin_pos_list", "coin_tuple", "coin_list", "goal_group",
+                 "arctracker_tuple", "obstacle_tuple", "goal_tuple", "goal_rect_list",
+                 "obstacle_grid", "circle_grid", "box_grid", "arctracker_radius_sq", "static_obstacle_tuple", "dynamic_obstacle_tuple",
+                 "static_obstacle_image", "static_obstacle_rect",
+                 "minimum_moves", "play_framecount", "level_playtime", "cleared", "complete_cnt", "total_arctracker_cnt",
+                 "bounds", "dirty_rects", "last_drawn_rects")
+
+    grid_cell_size = 128        # Size of each cell of obstacle grid in pixels
+    needs_update = True         # Has to be updated every frame when added to a screen
+
     def __init__(self,
                  arctracker_pos_list: List[Tuple[int, int]],
                  obstacle_list: List[Obstacle],
@@ -53,29 +70,90 @@ class Level:
                     self.arctracker_group.add(new_arctracker_clone)
             id_num += 1
 
-        # Generate and fill obstacle group
-        self.obstacle_group = pygame.sprite.Group()
-        for o in obstacle_list:
-            self.obstacle_group.add(o)
-
+        # Obstacles are kept in a plain tuple, since they are only scanned and never added or removed
+        self.obstacle_tuple = tuple(obstacle_list)
+        for o in self.obstacle_tuple:
             # Assign ArcTracker if there is a AngleFollower-kind of obstacle
             if isinstance(o, AngleFollowerImageObstacle):
                 o.assign_arctracker(self.arctracker_list[o.at_index])
 
-        # Generate and fill coin group
-        self.coin_group = pygame.sprite.Group()
+        # Generate all coins once, and keep coins not collected yet in a plain list (filled when level is initialized)
         self.coin_pos_list = coin_pos_list
+        self.coin_tuple = tuple(Coin(c) for c in coin_pos_list)
+        self.coin_list = []
 
         # Generate and fill goal group
         self.goal_group = pygame.sprite.Group()
         for g in goal_pos_list:
             self.goal_group.add(GoalPoint(g))
 
+        # Members of ArcTracker and goal groups never change after construction,
+        # so hot paths iterate these fixed tuples instead of the groups
+        self.arctracker_tuple = tuple(self.arctracker_group)
+        self.goal_tuple = tuple(self.goal_group)
+        self.goal_rect_list = [g.rect for g in self.goal_tuple]     # Rects of goal points in the same order
+
+        # Uniform grid of static obstacles for broad phase collision detection
+        # (keys: (column, row) of grid cell, values: list of obstacles whose rect overlaps the cell)
+        # Static circular and rectangular obstacles are kept in separate grids as plain data,
+        # (center x, center y, squared collision distance) and (left, top, right, bottom) respectively,
+        # so that they can be tested inline without calling collided() of each obstacle
+        # (all ArcTrackers and ArcTrackerClones have the same size, so collision distance is the same for all of them)
+        arctracker_radius = self.arctracker_tuple[0].rect.w // 2
+        self.arctracker_radius_sq = arctracker_radius ** 2
+        self.obstacle_grid = {}
+        self.circle_grid = {}
+        self.box_grid = {}
+        for o in self.obstacle_tuple:
+            if o.is_static:
+                for cell in self.get_grid_cells(o.rect):
+                    if isinstance(o, StaticCircularObstacle):
+                        circle = (o.rect.centerx, o.rect.centery, (o.radius + arctracker_radius) ** 2)
+                        self.circle_grid.setdefault(cell, []).append(circle)
+                    elif isinstance(o, StaticRectangularObstacle):
+                        box = (o.rect.left, o.rect.top, o.rect.right, o.rect.bottom)
+                        self.box_grid.setdefault(cell, []).append(box)
+                    else:
+                        self.obstacle_grid.setdefault(cell, []).append(o)
+        # Moving obstacles cannot be placed in the grid, so they are always checked
+        self.static_obstacle_tuple = tuple(o for o in self.obstacle_tuple if o.is_static)
+        self.dynamic_obstacle_tuple = tuple(o for o in self.obstacle_tuple if not o.is_static)
+
+        # All static obstacles pre-rendered into a single surface (rendered when first drawn)
+        self.static_obstacle_image = None
+        self.static_obstacle_rect = None
+
         self.minimum_moves = par      # Minimum possible movements to clear this level
         self.play_framecount = 0                # Level playtime counted in frames
         self.level_playtime = 0                 # Level playtime counted in seconds
 
         self.cleared = False                    # Cleared status
+        self.complete_cnt = 0                   # Number of ArcTrackers reached to GoalPoint
+        self.total_arctracker_cnt = len(self.arctracker_tuple)
+
+        # Area where ArcTrackers can stay in, which exceeds the screen by half the size of ArcTracker
+        max_w = max(a.rect.w for a in self.arctracker_tuple)
+        max_h = max(a.rect.h for a in self.arctracker_tuple)
+        left, right = -max_w // 2, screen_width + max_w // 2
+        top, bottom = -max_h // 2, screen_height + max_h // 2
+        self.bounds = pygame.Rect(left, top, right - left + 1, bottom - top + 1)
+
+        # Screen areas changed by the last draw (areas of moving sprites in both previous and current frame)
+        self.dirty_rects = []
+        self.last_drawn_rects = []
+
+    def get_grid_cells(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
+        """
+        Returns all cells of obstacle grid which overlap with given rect
+
+        :param rect: rect to find overlapping cells
+        :return: list of (column, row) of cells
+        """
+
+        cell_size = self.grid_cell_size
+        return [(col, row)
+                for col in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1)
+                for row in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1)]
 
     def initialize(self) -> None:
         """
@@ -85,72 +163,136 @@ class Level:
         """
 
         # Initialize all arc trackers
-        for a in self.arctracker_group:
+        for a in self.arctracker_tuple:
             a.initialize()
 
         # Initialize all obstacles
-        for o in self.obstacle_group:
+        for o in self.obstacle_tuple:
             o.initialize()
 
-        # Clear and refill coin group
-        self.coin_group.empty()
-        for c in self.coin_pos_list:
-            self.coin_group.add(Coin(c))
+        # Refill coin list with all coins
+        self.coin_list = list(self.coin_tuple)
 
         # Initialize all goal points
-        for g in self.goal_group:
+        for g in self.goal_tuple:
             g.initialize()
 
         # Initialize cleard status
         self.cleared = False
+        self.complete_cnt = 0
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Update all sprites(ArcTracker, obstacles, etc.) in this level
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
-        # Update all sprites in this level
-        self.arctracker_group.update(mouse_state, key_state)
-        self.obstacle_group.update(mouse_state, key_state)
-        self.coin_group.update(mouse_state, key_state)
-        self.goal_group.update(mouse_state, key_state)
+        # Snapshot sprite containers into locals once per frame and reuse them below
+        arctrackers = self.arctracker_tuple
+        coins = self.coin_list
+        goals = self.goal_tuple
+
+        # Update all sprites in this level (calling each update directly skips Group.update's argument packing)
+        for a in arctrackers:
+            a.update(mouse_state, key_state)
+        for o in self.obstacle_tuple:
+            o.update(mouse_state, key_state)
+        for c in coins:
+            c.update(mouse_state, key_state)
+        for g in goals:
+            g.update(mouse_state, key_state)
 
         # Check whether ArcTracker's position gets out of the screen
-        for a in self.arctracker_group:
-            if a.rect.centerx < -a.rect.w // 2 or a.rect.centerx > screen_width + a.rect.w // 2 or \
-               a.rect.centery < -a.rect.h // 2 or a.rect.centery > screen_height + a.rect.h // 2:
+        # Once the level is initialized, nothing else needs to be checked in this frame
+        bounds = self.bounds
+        for a in arctrackers:
+            if not bounds.collidepoint(a.rect.center):
                 self.initialize()
-                break
+                return
 
         # Detect collision between arc tracker and obstacles
-        for a in self.arctracker_group:
-            for o in self.obstacle_group:
-                if o.collided(a):
+        obstacle_grid = self.obstacle_grid
+        circle_grid = self.circle_grid
+        box_grid = self.box_grid
+        radius_sq = self.arctracker_radius_sq
+        dynamic_obstacles = self.dynamic_obstacle_tuple
+        get_grid_cells = self.get_grid_cells
+        for a in arctrackers:
+            # Only obstacles in grid cells which ArcTracker overlaps can collide with it
+            a_rect = a.rect
+            candidates = set(dynamic_obstacles)
+            circles = set()
+            boxes = set()
+            for cell in get_grid_cells(a_rect):
+                candidates.update(obstacle_grid.get(cell, ()))
+                circles.update(circle_grid.get(cell, ()))
+                boxes.update(box_grid.get(cell, ()))
+
+            # Same test as StaticCircularObstacle.collided, comparing squared distances
+            ax, ay = a_rect.center
+            for cx, cy, collide_sq in circles:
+                if (ax - cx) ** 2 + (ay - cy) ** 2 < collide_sq:
                     self.initialize()
-                    break
-
-        # Detect collision between arc tracker and coins
-        for a in self.arctracker_group:
-            for c in self.coin_group:
-                if distance(a.rect.center, c.rect.center) < 20:
-                    c.kill()
+                    return
+
+            # Same test as StaticRectangularObstacle.collided (rects overlap, and closest point is within radius)
+            a_left, a_top, a_right, a_bottom = a_rect.left, a_rect.top, a_rect.right, a_rect.bottom
+            for left, top, right, bottom in boxes:
+                if a_left < right and left < a_right and a_top < bottom and top < a_bottom:
+                    dx = ax - min(max(ax, left), right - 1)
+                    dy = ay - min(max(ay, top), bottom - 1)
+                    if dx * dx + dy * dy <= radius_sq:
+                        self.initialize()
+                        return
+
+            # Every obstacle shape lies inside its rect, so exact collision is checked only for overlapping rects
+            for o in candidates:
+                if o.rect.colliderect(a_rect) and o.collided(a):
+                    self.initialize()
+                    return
+
+        # Detect collision between arc tracker and coins, and kill all coins which ArcTracker reached
+        # Coins near ArcTracker are selected with a single rect test over all coins (collidelistall),
+        # and exact distance is checked only for those
+        if coins:
+            coin_rects = [c.rect for c in coins]
+            collected = set()       # Indices of collected coins
+            for a in arctrackers:
+                ax, ay = a.rect.center
+                for i in a.rect.inflate(2 * coin_collect_radius, 2 * coin_collect_radius).collidelistall(coin_rects):
+                    cx, cy = coin_rects[i].center
+                    if (ax - cx) ** 2 + (ay - cy) ** 2 < coin_collect_radius_sq:
+                        collected.add(i)
+            if collected:
+                self.coin_list = [c for i, c in enumerate(coins) if i not in collected]
+
+        # Goal points need to be checked only until the level is cleared
+        if self.cleared:
+            return
 
         # Determine whether arc tracker reached to goal point
-        for a in self.arctracker_group:
-            for g in self.goal_group:
-                # Lock-on will be available only when there is no coin left
-                if distance(a.rect.center, g.rect.center) < 10 and not g.arctracker_matched and len(self.coin_group) == 0:
-                    a.level_complete = True
-                    a.reject_path()
-                    g.arctracker_matched = True
-                    a.rect.center = g.rect.center       # Lock the position of ArcTracker to GoalPoint
+        # Lock-on will be available only when there is no coin left
+        if not self.coin_list:
+            goal_rects = self.goal_rect_list
+            for a in arctrackers:
+                ax, ay = a.rect.center
+                for i in a.rect.inflate(2 * goal_lock_radius, 2 * goal_lock_radius).collidelistall(goal_rects):
+                    g = goals[i]
+                    gx, gy = goal_rects[i].center
+                    if (ax - gx) ** 2 + (ay - gy) ** 2 < goal_lock_radius_sq and not g.arctracker_matched:
+                        if not a.level_complete:
+                            self.complete_cnt += 1
+                        a.level_complete = True
+                        a.reject_path()
+                        g.arctracker_matched = True
+                        a.rect.center = g.rect.center       # Lock the position of ArcTracker to GoalPoint
+                        break
 
         # Complete level if all ArcTrackers reached all GoalPoints
-        if all([a.level_complete for a in self.arctracker_group]):
+        if self.complete_cnt == self.total_arctracker_cnt:
             self.cleared = True
 
     def draw(self, surface: pygame.Surface) -> None:
@@ -161,172 +303,208 @@ class Level:
         :return: None
         """
 
-        # Draw all coins and obstacles in this level
-        self.coin_group.draw(surface)
-        self.obstacle_group.draw(surface)
-
-        # Draw all path of ArcTrackers
-        for a in self.arctracker_group:
-            if a.path:
-                surface.blit(a.path.image, a.path.rect)
-
-        # Draw all borderline of ArcTrackers
-        for a in self.arctracker_group:
-            if a.borderline:
-                surface.blit(a.borderline.image, a.borderline.rect)
-
-        # Draw all markers of ArcTrackers
-        for a in self.arctracker_group:
-            if a.axis_marker:
-                surface.blit(a.axis_marker.image, a.axis_marker.rect)
-
-        # Draw all ArcTrackers and GoalPoints in this level
-        self.goal_group.draw(surface)
-        self.arctracker_group.draw(surface)
-
-
-# Generate all levels (keys: level number, values: level class instance)
-level_dict = {
-    1: Level(arctracker_pos_list=[(150, screen_height // 2)],
-             obstacle_list=[
-             ],
-             coin_pos_list=[],
-             goal_pos_list=[(screen_width - 150, screen_height // 2)],
-             par=1,
-             arctracker_clone_list=[]),
-
-    2: Level(arctracker_pos_list=[(screen_width - 150, 150)],
-             obstacle_list=[
-                 StaticRectangularObstacle(760, 0, 400, 600),
-                 StaticRectangularObstacle(760, screen_height - 200, 400, 200)
-             ],
-             coin_pos_list=[],
-             goal_pos_list=[(150, 150)],
-             par=1,
-             arctracker_clone_list=[]),
-
-    3: Level(arctracker_pos_list=[(150, 150)],
-             obstacle_list=[
-                 StaticCircularObstacle(300, screen_height - 100, 700),
-                 StaticCircularObstacle(screen_width - 300, 100, 700)
-             ],
-             coin_pos_list=[],
-             goal_pos_list=[(screen_width - 150, screen_height - 150)],
-             par=2,
-             arctracker_clone_list=[]),
-
-    4: Level(arctracker_pos_list=[(450, screen_height // 2 - 100)],
-             obstacle_list=[
-                 StaticRectangularObstacle(0, screen_height // 2 - 20, 550, 40),
-                 StaticInnerCurvedObstacle(StaticCircularObstacle, (screen_width // 2, screen_height // 2, 450),
-                                           (screen_width // 2, screen_height // 2), 400)
-             ],
-             coin_pos_list=[],
-             goal_pos_list=[(450, screen_height // 2 + 100)],
-             par=1,
-             arctracker_clone_list=[]),
-
-    5: Level(arctracker_pos_list=[(150, screen_height // 2)],
-             obstacle_list=[
-                 StaticRectangularObstacle(270, 0, 300, screen_height // 2),
-                 StaticRectangularObstacle(990, 0, 300, screen_height // 2),
-                 StaticRectangularObstacle(630, screen_height // 2, 300, screen_height // 2),
-                 StaticRectangularObstacle(1350, screen_height // 2, 300, screen_height // 2),
-                 StaticCircularObstacle(420, screen_height // 2, 150),
-                 StaticCircularObstacle(780, screen_height // 2, 150),
-                 StaticCircularObstacle(1140, screen_height // 2, 150),
-                 StaticCircularObstacle(1500, screen_height // 2, 150)
-             ],
-             coin_pos_list=[],
-             goal_pos_list=[(screen_width - 150, screen_height // 2)],
-             par=4,
-             arctracker_clone_list=[]),
-
-    6: Level(arctracker_pos_list=[(350, screen_height // 2)],
-             obstacle_list=[
-                 StaticRectangularObstacle(0, 0, screen_width, 450),
-                 StaticRectangularObstacle(0, 0, 300, screen_height),
-                 StaticRectangularObstacle(0, screen_height - 450, screen_width, 450),
-                 StaticRectangularObstacle(screen_width - 300, 0, 300, screen_height)
-             ],
-             coin_pos_list=[],
-             goal_pos_list=[(screen_width - 350, screen_height // 2)],
-             par=2,
-             arctracker_clone_list=[]),
-
-    7: Level(arctracker_pos_list=[(150, screen_height // 2)],
-             obstacle_list=[
-             ],
-             coin_pos_list=[(1706, 454), (1586, 334), (1450, 237), (1293, 165), (1129, 121), (960, 107),
-                            (791, 121), (627, 165), (473, 237), (334, 334), (214, 454)],
-             goal_pos_list=[(screen_width - 150, screen_height // 2)],
-             par=1,
-             arctracker_clone_list=[]),
-
-    8: Level(arctracker_pos_list=[(150, screen_height // 2)],
-             obstacle_list=[
-             ],
-             coin_pos_list=[(960, 200), (960, 540), (960, 880)],
-             goal_pos_list=[(screen_width - 150, screen_height // 2)],
-             par=2,
-             arctracker_clone_list=[]),
-
-    9: Level(arctracker_pos_list=[(960, 500)],
-             obstacle_list=[
-             ],
-             coin_pos_list=[(900, 540)],
-             goal_pos_list=[(960, 580)],
-             par=2,
-             arctracker_clone_list=[]),
-
-    10: Level(arctracker_pos_list=[(150, 300)],
-              obstacle_list=[
-                  StaticCircularObstacle(300, 100, 50),
-                  StaticCircularObstacle(140, 800, 300),
-                  StaticCircularObstacle(1200, 1000, 100),
-                  StaticCircularObstacle(980, 500, 75),
-                  StaticCircularObstacle(400, 400, 120),
-                  StaticCircularObstacle(700, 100, 140),
-                  StaticCircularObstacle(800, 350, 60),
-                  StaticCircularObstacle(1500, 700, 200),
-                  StaticCircularObstacle(1150, 650, 100),
-                  StaticCircularObstacle(700, 700, 150),
-                  StaticCircularObstacle(1000, 900, 50),
-                  StaticCircularObstacle(1820, 80, 120),
-                  StaticCircularObstacle(1600, 350, 80),
-                  StaticCircularObstacle(1300, 200, 130),
-                  StaticCircularObstacle(1300, 400, 30),
-                  StaticCircularObstacle(1100, 300, 50),
-                  StaticCircularObstacle(900, 100, 70),
-              ],
-              coin_pos_list=[],
-              goal_pos_list=[(screen_width - 150, 800)],
-              par=2,
-              arctracker_clone_list=[]),
-
-    11: Level(arctracker_pos_list=[(screen_width - 150, 800)],
-              obstacle_list=[
-                  StaticCircularObstacle(300, 100, 50),
-                  StaticCircularObstacle(140, 800, 300),
-                  StaticCircularObstacle(1200, 1000, 100),
-                  StaticCircularObstacle(980, 500, 75),
-                  StaticCircularObstacle(400, 400, 120),
-                  StaticCircularObstacle(700, 100, 140),
-                  StaticCircularObstacle(800, 350, 60),
-                  StaticCircularObstacle(1500, 700, 200),
-                  StaticCircularObstacle(1150, 650, 100),
-                  StaticCircularObstacle(700, 700, 150),
-                  StaticCircularObstacle(1000, 900, 50),
-                  StaticCircularObstacle(1820, 80, 120),
-                  StaticCircularObstacle(1600, 350, 80),
-                  StaticCircularObstacle(1300, 200, 130),
-                  StaticCircularObstacle(1300, 400, 30),
-                  StaticCircularObstacle(1100, 300, 50),
-                  StaticCircularObstacle(900, 100, 70),
-              ],
-              coin_pos_list=[(1500, 473), (1275, 670), (1150, 773), (950, 850), (535, 750),
-                             (540, 440), (760, 260), (830, 440), (300, 170)],
-              goal_pos_list=[(150, 300)],
-              par=5,
-              arctracker_clone_list=[])
+        self.draw_static(surface)
+        self.draw_dynamic(surface)
+
+    def draw_static(self, surface: pygame.Surface) -> None:
+        """
+        Draw sprites which never change on screen (static obstacles)
+
+        These are drawn below all other sprites, so they can be drawn once as a background.
+
+        :param surface: Surface to draw on
+        :return: None
+        """
+
+        if not self.static_obstacle_tuple:
+            return
+
+        # Render static obstacles once, into a transparent surface which just covers all of them on the screen
+        if self.static_obstacle_image is None:
+            rect_list = [o.rect for o in self.static_obstacle_tuple]
+            self.static_obstacle_rect = rect_list[0].unionall(rect_list[1:]).clip(0, 0, screen_width, screen_height)
+            self.static_obstacle_image = pygame.Surface(self.static_obstacle_rect.size, SRCALPHA).convert_alpha()
+            offset_x, offset_y = -self.static_obstacle_rect.x, -self.static_obstacle_rect.y
+            self.static_obstacle_image.blits([(o.image, o.rect.move(offset_x, offset_y)) for o in self.static_obstacle_tuple], False)
+
+        surface.blit(self.static_obstacle_image, self.static_obstacle_rect)
+
+    def draw_dynamic(self, surface: pygame.Surface) -> None:
+        """
+        Draw sprites which can change on screen, and remember their areas
+
+        :param surface: Surface to draw on
+        :return: None
+        """
+
+        # Collect (image, rect) pairs of all sprites in drawing order, from the bottom layer to the top layer
+        # Coins and moving obstacles
+        blit_seq = [(c.image, c.rect) for c in self.coin_list]
+        blit_seq += [(o.image, o.rect) for o in self.dynamic_obstacle_tuple]
+        # Paths, borderlines and markers of ArcTrackers
+        blit_seq += [(a.path.image, a.path.rect) for a in self.arctracker_tuple if a.path]
+        blit_seq += [(a.borderline.image, a.borderline.rect) for a in self.arctracker_tuple if a.borderline]
+        blit_seq += [(a.axis_marker.image, a.axis_marker.rect) for a in self.arctracker_tuple if a.axis_marker]
+        # GoalPoints and ArcTrackers
+        blit_seq += [(g.image, g.rect) for g in self.goal_tuple]
+        blit_seq += [(a.image, a.rect) for a in self.arctracker_tuple]
+
+        # Draw all sprites with a single call
+        drawn_rects = surface.blits(blit_seq)
+        # Previous areas need to be erased too (areas of sprites which did not move are listed only once)
+        self.dirty_rects = list({tuple(r): r for r in drawn_rects + self.last_drawn_rects}.values())
+        self.last_drawn_rects = drawn_rects
+
+
+# Static obstacles shared by level 10 and level 11 (same layout, played in opposite direction)
+level10_obstacle_list = [
+    StaticCircularObstacle(300, 100, 50),
+    StaticCircularObstacle(140, 800, 300),
+    StaticCircularObstacle(1200, 1000, 100),
+    StaticCircularObstacle(980, 500, 75),
+    StaticCircularObstacle(400, 400, 120),
+    StaticCircularObstacle(700, 100, 140),
+    StaticCircularObstacle(800, 350, 60),
+    StaticCircularObstacle(1500, 700, 200),
+    StaticCircularObstacle(1150, 650, 100),
+    StaticCircularObstacle(700, 700, 150),
+    StaticCircularObstacle(1000, 900, 50),
+    StaticCircularObstacle(1820, 80, 120),
+    StaticCircularObstacle(1600, 350, 80),
+    StaticCircularObstacle(1300, 200, 130),
+    StaticCircularObstacle(1300, 400, 30),
+    StaticCircularObstacle(1100, 300, 50),
+    StaticCircularObstacle(900, 100, 70),
+]
+
+
+# Factories of all levels (keys: level number, values: function which creates level class instance)
+level_factory_dict = {
+    1: lambda: Level(arctracker_pos_list=[(150, screen_height // 2)],
+                     obstacle_list=[
+                     ],
+                     coin_pos_list=[],
+                     goal_pos_list=[(screen_width - 150, screen_height // 2)],
+                     par=1,
+                     arctracker_clone_list=[]),
+
+    2: lambda: Level(arctracker_pos_list=[(screen_width - 150, 150)],
+                     obstacle_list=[
+                         StaticRectangularObstacle(760, 0, 400, 600),
+                         StaticRectangularObstacle(760, screen_height - 200, 400, 200)
+                     ],
+                     coin_pos_list=[],
+                     goal_pos_list=[(150, 150)],
+                     par=1,
+                     arctracker_clone_list=[]),
+
+    3: lambda: Level(arctracker_pos_list=[(150, 150)],
+                     obstacle_list=[
+                         StaticCircularObstacle(300, screen_height - 100, 700),
+                         StaticCircularObstacle(screen_width - 300, 100, 700)
+                     ],
+                     coin_pos_list=[],
+                     goal_pos_list=[(screen_width - 150, screen_height - 150)],
+                     par=2,
+                     arctracker_clone_list=[]),
+
+    4: lambda: Level(arctracker_pos_list=[(450, screen_height // 2 - 100)],
+                     obstacle_list=[
+                         StaticRectangularObstacle(0, screen_height // 2 - 20, 550, 40),
+                         StaticInnerCurvedObstacle(StaticCircularObstacle, (screen_width // 2, screen_height // 2, 450),
+                                                   (screen_width // 2, screen_height // 2), 400)
+                     ],
+                     coin_pos_list=[],
+                     goal_pos_list=[(450, screen_height // 2 + 100)],
+                     par=1,
+                     arctracker_clone_list=[]),
+
+    5: lambda: Level(arctracker_pos_list=[(150, screen_height // 2)],
+                     obstacle_list=[
+                         StaticRectangularObstacle(270, 0, 300, screen_height // 2),
+                         StaticRectangularObstacle(990, 0, 300, screen_height // 2),
+                         StaticRectangularObstacle(630, screen_height // 2, 300, screen_height // 2),
+                         StaticRectangularObstacle(1350, screen_height // 2, 300, screen_height // 2),
+                         StaticCircularObstacle(420, screen_height // 2, 150),
+                         StaticCircularObstacle(780, screen_height // 2, 150),
+                         StaticCircularObstacle(1140, screen_height // 2, 150),
+                         StaticCircularObstacle(1500, screen_height // 2, 150)
+                     ],
+                     coin_pos_list=[],
+                     goal_pos_list=[(screen_width - 150, screen_height // 2)],
+                     par=4,
+                     arctracker_clone_list=[]),
+
+    6: lambda: Level(arctracker_pos_list=[(350, screen_height // 2)],
+                     obstacle_list=[
+                         StaticRectangularObstacle(0, 0, screen_width, 450),
+                         StaticRectangularObstacle(0, 0, 300, screen_height),
+                         StaticRectangularObstacle(0, screen_height - 450, screen_width, 450),
+                         StaticRectangularObstacle(screen_width - 300, 0, 300, screen_height)
+                     ],
+                     coin_pos_list=[],
+                     goal_pos_list=[(screen_width - 350, screen_height // 2)],
+                     par=2,
+                     arctracker_clone_list=[]),
+
+    7: lambda: Level(arctracker_pos_list=[(150, screen_height // 2)],
+                     obstacle_list=[
+                     ],
+                     coin_pos_list=[(1706, 454), (1586, 334), (1450, 237), (1293, 165), (1129, 121), (960, 107),
+                                    (791, 121), (627, 165), (473, 237), (334, 334), (214, 454)],
+                     goal_pos_list=[(screen_width - 150, screen_height // 2)],
+                     par=1,
+                     arctracker_clone_list=[]),
+
+    8: lambda: Level(arctracker_pos_list=[(150, screen_height // 2)],
+                     obstacle_list=[
+                     ],
+                     coin_pos_list=[(960, 200), (960, 540), (960, 880)],
+                     goal_pos_list=[(screen_width - 150, screen_height // 2)],
+                     par=2,
+                     arctracker_clone_list=[]),
+
+    9: lambda: Level(arctracker_pos_list=[(960, 500)],
+                     obstacle_list=[
+                     ],
+                     coin_pos_list=[(900, 540)],
+                     goal_pos_list=[(960, 580)],
+                     par=2,
+                     arctracker_clone_list=[]),
+
+    10: lambda: Level(arctracker_pos_list=[(150, 300)],
+                      obstacle_list=level10_obstacle_list,
+                      coin_pos_list=[],
+                      goal_pos_list=[(screen_width - 150, 800)],
+                      par=2,
+                      arctracker_clone_list=[]),
+
+    11: lambda: Level(arctracker_pos_list=[(screen_width - 150, 800)],
+                      obstacle_list=level10_obstacle_list,
+                      coin_pos_list=[(1500, 473), (1275, 670), (1150, 773), (950, 850), (535, 750),
+                                     (540, 440), (760, 260), (830, 440), (300, 170)],
+                      goal_pos_list=[(150, 300)],
+                      par=5,
+                      arctracker_clone_list=[])
 }
+
+
+# Levels created so far (keys: level number, values: level class instance)
+level_dict = {}
+
+
+def get_level(levelnum: int) -> Level:
+    """
+    Returns level of given number
+
+    Each level is created when it is requested for the first time, so that loading the game
+    does not need to create sprites and surfaces of all levels.
+
+    :param levelnum: Number of level
+    :return: Level class instance
+    """
+
+    if levelnum not in level_dict:
+        level_dict[levelnum] = level_factory_dict[levelnum]()
+
+    return level_dict[levelnum]
@@ -4,47 +4,94 @@ Actually running game loop
 
 
 from screens import *
+import screens
 import init
+import time
 
 
-mainmenu_screen.show()
+def main() -> None:
+    """
+    Run main game loop until the game is quit
 
+    Functions called every frame are bound to local names once, before the loop starts.
 
-# Main game loop
-while init.running:
+    :return: None
+    """
 
-    # Get all kind of events generated from mouse
-    pygame.event.get()
-    mouse[LCLICK], mouse[MCLICK], mouse[RCLICK], mouse[SCRLUP], mouse[SCRLDN] = pygame.mouse.get_pressed(5)
-    mouse[CURPOS] = pygame.mouse.get_pos()        # Get cursor position on the screen
+    get_events = pygame.event.get
+    wait_event = pygame.event.wait
+    get_key_pressed = pygame.key.get_pressed
+    handle_mouse_event = mouse.handle_event
+    flip_display = pygame.display.flip
+    update_display = pygame.display.update
+    perf_counter = time.perf_counter
+    sleep = time.sleep
 
-    # Get all kind of events generated from keyboard
-    keys = pygame.key.get_pressed()
+    mainmenu_screen.show()
 
-    # Update and draw main menu screen
-    if mainmenu_screen.now_display:
-        mainmenu_screen.update(mouse, keys)
-        mainmenu_screen.draw(screen)
+    # Initial input state (updated only by events afterwards)
+    mouse.curpos = pygame.mouse.get_pos()
+    keys = get_key_pressed()
+    idle = False        # Whether nothing can change on screen until next input event
+    frame_start = perf_counter()
 
-    # Update and draw level selection screen
-    elif level_select_screen.now_display:
-        level_select_screen.update(mouse, keys)
-        level_select_screen.draw(screen)
+    # Main game loop
+    while init.running:
 
-    # Update and draw how-to-play screen
-    elif how_to_play_screen.now_display:
-        how_to_play_screen.update(mouse, keys)
-        how_to_play_screen.draw(screen)
+        # Menu screens change only by input, so sleep until an event arrives (or wait time passes) while idle
+        events = get_events()
+        if idle and not events:
+            event = wait_event(IDLE_WAIT_TIME)
+            if event.type != NOEVENT:
+                events = [event] + get_events()
 
-    # Update and draw settings screen
-    elif settings_screen.now_display:
-        settings_screen.update(mouse, keys)
-        settings_screen.draw(screen)
+        # Walk all events of this frame once: apply mouse events to mouse state,
+        # poll keyboard only when a key event arrived, and stop the game when window is closed
+        key_changed = False
+        for event in events:
+            if event.type == KEYDOWN or event.type == KEYUP:
+                key_changed = True
+            elif event.type == QUIT:
+                init.running = False
+            else:
+                handle_mouse_event(event)
+        if key_changed:
+            keys = get_key_pressed()
 
-    # Update and draw gameplay screen
-    elif gameplay_screen.now_display:
-        gameplay_screen.update(mouse, keys)
-        gameplay_screen.draw(screen)
+        # Update and draw the screen which is displayed now
+        active_screen = screens.active_screen
+        active_screen.update(mouse, keys)
+        dirty_rects = active_screen.draw(screen)
 
-    pygame.display.flip()                           # Update all display changes and show them
-    init.DELTA_TIME = fps_clock.tick(FPS) / 1000    # Get time difference between present and previous game loop in seconds
+        # Update only changed areas of the screen if they are known, otherwise update whole screen
+        if dirty_rects is None:
+            flip_display()
+        else:
+            update_display(dirty_rects)
+
+        # Gameplay screen keeps animating, and a newly shown screen has to be drawn in next frame without waiting
+        idle = active_screen is not gameplay_screen and active_screen is screens.active_screen
+
+        # Get time difference between present and previous game loop in seconds
+        # (perf_counter is a monotonic clock with the highest available resolution)
+        frame_end = frame_start + FRAME_TIME
+        remaining_time = frame_end - perf_counter()
+        if remaining_time > 0:
+            # Wait until frame time passes: sleep for most of the remaining time, since sleeping may wake up late,
+            # and spin for the rest
+            if remaining_time > SPIN_TIME:
+                sleep(remaining_time - SPIN_TIME)
+            while perf_counter() < frame_end:
+                pass
+            # Frames are kept on a fixed schedule, so that a late wake-up is made up in next frame
+            init.DELTA_TIME = FRAME_TIME
+            frame_start = frame_end
+        else:
+            # Next frame starts right now if this frame took longer than frame time
+            now = perf_counter()
+            init.DELTA_TIME = now - frame_start
+            frame_start = now
+
+
+if __name__ == "__main__":
+    main()
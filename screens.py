@@ -4,7 +4,14 @@ Defines all scenes(screens) of the game
 import pygame.sprite
 
 from sprites_and_functions import *
-from levels import level_dict
+from levels import level_factory_dict, get_level
+
+
+# Setter of each fixpoint attribute of Rect (keys: fixpoint name, values: function setting the fixpoint of a rect to a position)
+fixpoint_setters = {fixpoint: getattr(pygame.Rect, fixpoint).__set__
+                    for fixpoint in ("topleft", "midtop", "topright",
+                                     "midleft", "center", "midright",
+                                     "bottomleft", "midbottom", "bottomright")}
 
 
 class ImageView(pygame.sprite.Sprite):
@@ -12,10 +19,12 @@ class ImageView(pygame.sprite.Sprite):
     A rectanguler object to display an image
     """
 
-    def __init__(self, image: pygame.Surface, size: (int, int), pos: (int, int), fixpoint="topleft"):
+    needs_update = False        # Update method does nothing
+
+    def __init__(self, image: Union[pygame.Surface, str], size: (int, int), pos: (int, int), fixpoint="topleft"):
         """
 
-        :param image: image surface object to display
+        :param image: image surface object to display, or path of the image file to load when first drawn
         :param size: size of the image
         :param pos: position of the image
         :param fixpoint: fixpoint of the image
@@ -23,10 +32,13 @@ class ImageView(pygame.sprite.Sprite):
 
         pygame.sprite.Sprite.__init__(self)
 
-        self.image = pygame.transform.scale(image, size)
-        self.rect = self.image.get_rect()
+        self.image_source = image           # Image surface or path of the image file
+        self.size = size
+        self.image = None                   # Scaled image will be created when first drawn
+        self.rect = pygame.Rect((0, 0), size)
         self.pos = pos
         self.fixpoint = fixpoint
+        self.set_fixpoint = fixpoint_setters[fixpoint]  # Setter of the fixpoint, looked up only once
         self.fix_position()
 
     def fix_position(self) -> None:
@@ -35,30 +47,13 @@ class ImageView(pygame.sprite.Sprite):
         :return: None
         """
 
-        if self.fixpoint == "topleft":
-            self.rect.topleft = self.pos
-        elif self.fixpoint == "midtop":
-            self.rect.midtop = self.pos
-        elif self.fixpoint == "topright":
-            self.rect.topright = self.pos
-        elif self.fixpoint == "midleft":
-            self.rect.midleft = self.pos
-        elif self.fixpoint == "center":
-            self.rect.center = self.pos
-        elif self.fixpoint == "midright":
-            self.rect.midright = self.pos
-        elif self.fixpoint == "bottomleft":
-            self.rect.bottomleft = self.pos
-        elif self.fixpoint == "midbottom":
-            self.rect.midbottom = self.pos
-        elif self.fixpoint == "bottomright":
-            self.rect.bottomright = self.pos
-
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+        self.set_fixpoint(self.rect, self.pos)
+
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
@@ -70,15 +65,21 @@ class ImageView(pygame.sprite.Sprite):
         :return: None
         """
 
+        # Load and scale the image only when it is drawn for the first time
+        if self.image is None:
+            if isinstance(self.image_source, str):
+                self.image_source = load_image(self.image_source)
+            self.image = pygame.transform.scale(self.image_source, self.size)
+
         surface.blit(self.image, self.rect)
 
 
-class Button(pygame.sprite.Sprite):
+class Button:
     """
     A rectangular button class
-    """
 
-    group = pygame.sprite.Group()       # Button's own sprite group
+    Buttons are kept in plain lists of the screen they are on (see Screen.add_button), not in sprite groups.
+    """
 
     def __init__(self, rect: List[int], text: str, text_font: str, text_font_size: int, color: Tuple[int, int, int], default_back_color=(0, 0, 0)):
         """
@@ -91,8 +92,6 @@ class Button(pygame.sprite.Sprite):
         :param default_back_color: color of background of button, default value is black(0, 0, 0)
         """
 
-        pygame.sprite.Sprite.__init__(self)
-
         # Rect attribute
         self.rect = pygame.Rect(rect)
 
@@ -103,8 +102,8 @@ class Button(pygame.sprite.Sprite):
 
         # Color attrubutes
         self.active_color = color
-        self.font = pygame.font.SysFont(self.text_font, self.text_font_size)
-        self.text_surface = self.font.render(self.text, True, self.active_color)
+        self.font = get_font(self.text_font, self.text_font_size)
+        self.text_surface = render_text(self.font, self.text, self.active_color)
         self.text_surface_rect = self.text_surface.get_rect(center=self.rect.center)
 
         # Background color attributes
@@ -127,9 +126,12 @@ class Button(pygame.sprite.Sprite):
         self.active = True
         self.cursor_in_rect = False
         self.is_clicked = False
+        self.changed = True         # Whether appearance of button has changed since it was drawn last time
 
-        # Add self to button group
-        self.group.add(self)
+        # Whole images of button for each pair of (background color, boundary color), rendered when first drawn
+        # Text is drawn in these images only if it fits in the button, otherwise it is drawn separately
+        self.state_images = {}
+        self.text_in_rect = self.rect.contains(self.text_surface_rect)
 
     def activate(self) -> None:
         """
@@ -138,10 +140,9 @@ class Button(pygame.sprite.Sprite):
         """
 
         self.current_color = self.active_color
-        # Rerender text surface with newly set color
-        self.text_surface = self.font.render(self.text, True, self.active_color)
-        self.text_surface_rect = self.text_surface.get_rect(center=self.rect.center)
+        # Text is always rendered with active color, so text surface does not need to be rendered again
         self.active = True      # Update method will be executed
+        self.changed = True
 
     def deactivate(self) -> None:
         """
@@ -150,41 +151,53 @@ class Button(pygame.sprite.Sprite):
         """
 
         self.current_color = self.inactive_color
-        # Rerender text surface with newly set color
-        self.text_surface = self.font.render(self.text, True, self.active_color)
-        self.text_surface_rect = self.text_surface.get_rect(center=self.rect.center)
+        # Text is always rendered with active color, so text surface does not need to be rendered again
         self.active = False     # Update method will be passed
+        self.cursor_in_rect = False
+        self.is_clicked = False
         self.current_back_color = self.default_back_color
+        self.changed = True
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
         Check whether cursor is in button or clicked the button when button is active(clickable).
         Only if click-and-release the button, operate() method will be executed.
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
-        # Check whether cursor is in button boundary and change background color
-        if self.active and self.rect.collidepoint(mouse_state[CURPOS]):
-            self.cursor_in_rect = True
-            self.current_back_color = self.hovered_back_color       # Change background status
-        else:
-            self.cursor_in_rect = False
-            self.current_back_color = self.default_back_color       # Change background status
+        # Inactive button is not clickable and its state is reset by deactivate()
+        if not self.active:
+            return
+
+        # Check whether cursor is in button boundary
+        cursor_in_rect = self.rect.collidepoint(mouse_state.curpos)
+        is_clicked = self.is_clicked
+        lclick = mouse_state.lclick
 
         # Check mouse click event when the cursor is in button
-        if self.cursor_in_rect and mouse_state[LCLICK]:
-            self.is_clicked = True
-            self.current_back_color = self.clicked_back_color       # Change background status
+        if cursor_in_rect and lclick:
+            is_clicked = True
         # Check mouse release event when clicked
-        if self.is_clicked and not mouse_state[LCLICK]:
+        elif is_clicked and not lclick:
             self.operate()                                          # Operate the button
-            self.is_clicked = False
-            self.current_back_color = self.hovered_back_color       # Change background status
+            is_clicked = False
+
+        # Change background status only when cursor enters or leaves the button, or when it is clicked or released
+        if cursor_in_rect != self.cursor_in_rect or is_clicked != self.is_clicked:
+            self.cursor_in_rect = cursor_in_rect
+            self.is_clicked = is_clicked
+            if not cursor_in_rect:
+                self.current_back_color = self.default_back_color
+            elif is_clicked:
+                self.current_back_color = self.clicked_back_color
+            else:
+                self.current_back_color = self.hovered_back_color
+            self.changed = True
 
     def operate(self) -> None:
         """
@@ -202,9 +215,21 @@ class Button(pygame.sprite.Sprite):
         :return: None
         """
 
-        pygame.draw.rect(surface, self.current_back_color, self.rect)   # Draw background first
-        pygame.draw.rect(surface, self.current_color, self.rect, 3)     # Draw boundary of button
-        surface.blit(self.text_surface, self.text_surface_rect)         # Draw text in button
+        key = (self.current_back_color, self.current_color)
+        image = self.state_images.get(key)
+        if image is None:
+            image = pygame.Surface(self.rect.size).convert()
+            image.fill(self.current_color)                                          # Fill with boundary color first
+            image.fill(self.current_back_color, image.get_rect().inflate(-6, -6))   # Fill background inside boundary of width 3
+            if self.text_in_rect:
+                image.blit(self.text_surface, self.text_surface_rect.move(-self.rect.x, -self.rect.y))    # Draw text in button
+            self.state_images[key] = image
+
+        surface.blit(image, self.rect)
+        if not self.text_in_rect:
+            surface.blit(self.text_surface, self.text_surface_rect)     # Draw text exceeding button
+
+        self.changed = False
 
 
 class LevelSelectButton(Button):
@@ -223,7 +248,7 @@ class LevelSelectButton(Button):
 
         # Screen class in which this button is included
         self.on_screen = on_screen
-        self.on_screen.manage_list.append(self)     # Add this button to this screen
+        self.on_screen.add_button(self)             # Add this button to this screen
 
     def operate(self) -> None:
         """
@@ -252,7 +277,7 @@ class HowToPlayButton(Button):
 
         # Screen class in which this button is included
         self.on_screen = on_screen
-        self.on_screen.manage_list.append(self)     # Add this button to this screen
+        self.on_screen.add_button(self)             # Add this button to this screen
 
     def operate(self) -> None:
         """
@@ -281,7 +306,7 @@ class SettingsButton(Button):
 
         # Screen class in which this button is included
         self.on_screen = on_screen
-        self.on_screen.manage_list.append(self)     # Add this button to this screen
+        self.on_screen.add_button(self)             # Add this button to this screen
 
     def operate(self) -> None:
         """
@@ -310,7 +335,7 @@ class QuitButton(Button):
 
         # Screen class in which this button is included
         self.on_screen = on_screen
-        self.on_screen.manage_list.append(self)     # Add this button to this screen
+        self.on_screen.add_button(self)             # Add this button to this screen
 
     def operate(self) -> None:
         """
@@ -338,7 +363,7 @@ class MainMenuButton(Button):
 
         # Screen class in which this button is included
         self.on_screen = on_screen
-        self.on_screen.manage_list.append(self)     # Add this button to this screen
+        self.on_screen.add_button(self)             # Add this button to this screen
 
     def operate(self) -> None:
         """
@@ -373,7 +398,7 @@ class LevelButton(Button):
 
         # Screen class in which this button is included
         self.on_screen = on_screen
-        self.on_screen.manage_list.append(self)     # Add this button to this screen
+        self.on_screen.add_button(self)             # Add this button to this screen
 
     def operate(self) -> None:
         """
@@ -382,7 +407,7 @@ class LevelButton(Button):
         :return: None
         """
 
-        if self.levelnum <= len(level_dict):
+        if self.levelnum <= len(level_factory_dict):
             self.on_screen.hide()
             gameplay_screen.intialize_level(self.levelnum)
             gameplay_screen.show()
@@ -402,9 +427,8 @@ class NextLevelButton(Button):
 
         Button.__init__(self, [screen_width // 2 - 150, screen_height // 2 + 100, 300, 70], "NEXT LEVEL", "verdana", 30, WHITE1, WHITE3)
 
-        # Screen class in which this button is included
+        # Screen class in which this button is included (updated and drawn by LevelClearedWindow, not by the screen)
         self.on_screen = on_screen
-        self.on_screen.manage_list.append(self)     # Add this button to this screen
 
     def operate(self) -> None:
         """
@@ -430,9 +454,8 @@ class RetryButton(Button):
 
         Button.__init__(self, [screen_width // 2 - 150, screen_height // 2 + 200, 300, 70], "RETRY", "verdana", 30, WHITE1, WHITE3)
 
-        # Screen class in which this button is included
+        # Screen class in which this button is included (updated and drawn by LevelClearedWindow, not by the screen)
         self.on_screen = on_screen
-        self.on_screen.manage_list.append(self)     # Add this button to this screen
 
     def operate(self) -> None:
         """
@@ -458,9 +481,8 @@ class BackToLevelSelectButton(Button):
 
         Button.__init__(self, [screen_width // 2 - 150, screen_height // 2 + 300, 300, 70], "LEVEL SELECT", "verdana", 30, WHITE1, WHITE3)
 
-        # Screen class in which this button is included
+        # Screen class in which this button is included (updated and drawn by LevelClearedWindow, not by the screen)
         self.on_screen = on_screen
-        self.on_screen.manage_list.append(self)     # Add this button to this screen
 
     def operate(self) -> None:
         """
@@ -478,17 +500,20 @@ class Text:
     A text surface class to display all texts appearing in this game
     """
 
+    needs_update = False        # Update method does nothing (text is changed only by update_text)
+
     def __init__(self, text: str, font: str, font_size: int, pos: (int, int), fixpoint="topleft", color=WHITE1):
         self.text = text                                                    # Content to display
         self.font_size = font_size                                          # Size of this text
-        self.font = pygame.font.SysFont(font, self.font_size)               # Create font
+        self.font = get_font(font, self.font_size)                          # Get font (shared with other texts)
         self.color = color                                                  # Color of this text
-        self.text_surface = self.font.render(self.text, True, self.color)   # Create text surface
+        self.text_surface = render_text(self.font, self.text, self.color)   # Create text surface
         self.rect = self.text_surface.get_rect()                            # Surface rect
 
         # Position attributes
         self.pos = pos              # Position on screen to display
         self.fixpoint = fixpoint    # Position to fix the text
+        self.set_fixpoint = fixpoint_setters[fixpoint]      # Setter of the fixpoint, looked up only once
         self.fix_position()
 
     def fix_position(self) -> None:
@@ -497,30 +522,13 @@ class Text:
         :return: None
         """
 
-        if self.fixpoint == "topleft":
-            self.rect.topleft = self.pos
-        elif self.fixpoint == "midtop":
-            self.rect.midtop = self.pos
-        elif self.fixpoint == "topright":
-            self.rect.topright = self.pos
-        elif self.fixpoint == "midleft":
-            self.rect.midleft = self.pos
-        elif self.fixpoint == "center":
-            self.rect.center = self.pos
-        elif self.fixpoint == "midright":
-            self.rect.midright = self.pos
-        elif self.fixpoint == "bottomleft":
-            self.rect.bottomleft = self.pos
-        elif self.fixpoint == "midbottom":
-            self.rect.midbottom = self.pos
-        elif self.fixpoint == "bottomright":
-            self.rect.bottomright = self.pos
-
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+        self.set_fixpoint(self.rect, self.pos)
+
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
@@ -536,7 +544,7 @@ class Text:
 
         # Render the new text and create new text surface and rect
         self.text = new_text
-        self.text_surface = self.font.render(self.text, True, self.color)
+        self.text_surface = render_text(self.font, self.text, self.color)
         self.rect = self.text_surface.get_rect()
 
         # Fix position again
@@ -557,6 +565,8 @@ class TextGroupBox(pygame.sprite.Sprite):
     An invisible box which contains multiple line of texts
     """
 
+    needs_update = False        # Update method does nothing
+
     def __init__(self, text_list: List[str], font: str, font_size: int, pos: (int, int), color=WHITE1, margin=10, line_space=10):
         """
         Initializing method
@@ -574,7 +584,7 @@ class TextGroupBox(pygame.sprite.Sprite):
 
         # Font, size, and color of text
         self.font_size = font_size
-        self.font = pygame.font.SysFont(font, self.font_size)
+        self.font = get_font(font, self.font_size)
         self.color = color
 
         # Text surfaces and rects list
@@ -583,7 +593,7 @@ class TextGroupBox(pygame.sprite.Sprite):
 
         # Fill in all lists
         for text in text_list:
-            text_surface = self.font.render(text, True, self.color)
+            text_surface = render_text(self.font, text, self.color)
             text_rect = text_surface.get_rect()
 
             self.text_surface_list.append(text_surface)
@@ -605,11 +615,11 @@ class TextGroupBox(pygame.sprite.Sprite):
             self.image.blit(surf, rect)
             current_text_pos_y += self.font_size + line_space
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
@@ -631,6 +641,7 @@ class PopupTextBox(pygame.sprite.Sprite):
     """
 
     group = pygame.sprite.Group()  # PopupTextBox' own sprite group
+    needs_update = True             # Moves every frame
 
     def __init__(self, text: str):
         """
@@ -644,8 +655,8 @@ class PopupTextBox(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self)
 
         # Create text surface object
-        self.font = pygame.font.SysFont("verdana", 20)              # Font and size of text
-        self.text_surface = self.font.render(text, True, WHITE1)    # Contents of text
+        self.font = get_font("verdana", 20)                         # Font and size of text
+        self.text_surface = render_text(self.font, text, WHITE1)    # Contents of text
         self.text_rect = self.text_surface.get_rect()               # A virtual rectangle enclosing text surface
 
         # Create box surface object
@@ -678,11 +689,11 @@ class PopupTextBox(pygame.sprite.Sprite):
         # Add this sprite to sprite groups
         self.group.add(self)
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
@@ -745,11 +756,11 @@ class LevelClearedWindow:
         self.retry_button = RetryButton(on_screen)
         self.level_select_button = BackToLevelSelectButton(on_screen)
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Update all texts/buttons on this window
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
@@ -781,52 +792,154 @@ class Screen:
     inherit this class.
     """
 
+    max_dirty_rect_cnt = 25     # Whole screen is updated if at least this many areas are changed in a frame
+
     def __init__(self):
         """
         Initializing method
 
         Screen class has a "manage_list" attribute, which contains all texts and buttons
-        appeared in screen for updating and drawing. Sprites for gameplay
+        appeared in screen for drawing, and "update_list" attribute, which contains only the ones
+        that have to be updated. Items are added by add() and add_button() methods. Sprites for gameplay
         (such as ArcTracker, Obstacles, etc...) will not be included,
         because they already have their own sprite group, update and draw method.
         """
 
         self.manage_list = []
+        self.update_list = []           # Items in manage_list whose update method actually changes them (except buttons)
+        self.button_list = []           # All buttons in manage_list
+        self.button_rect_list = []      # Rects of all buttons in button_list, in the same order
+        self.engaged_indices = []       # Indices of buttons which the cursor was in or which were clicked in last update
         self.now_display = False        # Whether show this screen now or not
+        self.full_redraw = True         # Whether whole screen has to be cleared and drawn in next frame
+        self.background = None          # Everything on this screen except buttons, rendered when first drawn
+
+    def add(self, item) -> None:
+        """
+        Add a text or other item to this screen
+
+        Items which never change by updating (whose class has false needs_update) are only drawn.
+
+        :param item: Item to be drawn (and updated) on this screen
+        :return: None
+        """
+
+        self.manage_list.append(item)
+        if item.needs_update:
+            self.update_list.append(item)
+
+    def add_button(self, button: Button) -> None:
+        """
+        Add a button to this screen
+
+        :param button: Button to be updated and drawn on this screen
+        :return: None
+        """
+
+        self.manage_list.append(button)
+        self.button_list.append(button)
+        self.button_rect_list.append(button.rect)
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Update all texts/buttons on this screen
 
-        :param mouse_state: Dictionary of clicking event and position info
+        A button can change only when the cursor is in it or it has been clicked,
+        so only buttons under the cursor and buttons engaged in last update are updated.
+
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
-        for t in self.manage_list:
+        if not self.now_display:
+            return
+
+        for t in self.update_list:
             t.update(mouse_state, key_state)
 
-    def draw(self, surface: pygame.Surface) -> None:
+        # Find buttons under the cursor with a single collision test against rects of all buttons
+        button_list = self.button_list
+        cursor_rect = pygame.Rect(mouse_state.curpos, (1, 1))
+        update_indices = sorted(set(self.engaged_indices).union(cursor_rect.collidelistall(self.button_rect_list)))
+
+        engaged_indices = []
+        for i in update_indices:
+            b = button_list[i]
+            b.update(mouse_state, key_state)
+            if b.cursor_in_rect or b.is_clicked:
+                engaged_indices.append(i)
+        self.engaged_indices = engaged_indices
+
+    def draw_background(self, surface: pygame.Surface) -> None:
         """
-        Draw all texts/buttons on this screen
+        Draw everything on this screen except buttons, which never changes while this screen is displayed
 
         :param surface: Surface to draw on
         :return: None
         """
 
-        screen.fill(BLACK)
-
+        surface.fill(BLACK)
         for t in self.manage_list:
-            t.draw(surface)
+            if not isinstance(t, Button):
+                t.draw(surface)
+
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        Draw all texts/buttons on this screen
+
+        Everything except buttons is rendered into background surface only once.
+        Whole screen is restored from the background and buttons are drawn on it only in the first frame
+        after this screen is shown. Afterwards only buttons can change, so only areas of buttons whose appearance
+        has changed are restored, drawn and updated on display.
+
+        :param surface: Surface to draw on
+        :return: Changed areas of screen, or None if whole screen has to be updated
+        """
+
+        # Screen hidden in this frame is replaced by the newly shown screen in next frame
+        if not self.now_display:
+            return []
+
+        if self.full_redraw:
+            if self.background is None:
+                self.background = pygame.Surface(surface.get_size()).convert()
+                self.draw_background(self.background)
+            surface.blit(self.background, (0, 0))
+            for t in self.button_list:
+                t.draw(surface)
+            self.full_redraw = False
+            return None
+
+        background = self.background
+        dirty_rects = []
+        for t in self.button_list:
+            if t.changed:
+                area = t.rect.union(t.text_surface_rect)    # Text may be wider than button
+                surface.blit(background, area, area)
+                t.draw(surface)
+                dirty_rects.append(area)
+
+        # Updating many separate areas costs more than updating whole screen at once
+        if len(dirty_rects) >= self.max_dirty_rect_cnt:
+            return None
+
+        return dirty_rects
 
     def show(self) -> None:
         """
         Display this screen
 
+        This screen also becomes the active screen, which is updated and drawn by main game loop.
+
         :return: None
         """
 
+        global active_screen
+
         self.now_display = True
+        self.full_redraw = True
+        active_screen = self
 
     def hide(self) -> None:
         """
@@ -853,7 +966,7 @@ class MainMenuScreen(Screen):
         Screen.__init__(self)
 
         self.title_text = Text("ARC TRACKER", "verdana", 80, (screen_width // 2, screen_height // 6), "center")     # Text object
-        self.manage_list.append(self.title_text)            # Append this text to manage_list
+        self.add(self.title_text)                           # Add this text to this screen
 
         self.level_select_button = LevelSelectButton(self)  # Button for level selection
         self.how_to_play_button = HowToPlayButton(self)     # Button for how to play
@@ -876,10 +989,10 @@ class LevelSelectScreen(Screen):
         Screen.__init__(self)
 
         self.title_text = Text("SELECT LEVEL", "verdana", 70, (screen_width // 2, screen_height // 6), "center")     # Text object
-        self.manage_list.append(self.title_text)            # Append this text to manage_list
+        self.add(self.title_text)                           # Add this text to this screen
 
         # Generate 5x10 button array
-        self.all_level_buttons = pygame.sprite.Group()      # Group of all buttons connected to each level
+        self.all_level_buttons = []                         # List of all buttons connected to each level
         # Width and height of the entire button array
         btn_group_width = 1600
         btn_group_height = 550
@@ -893,9 +1006,9 @@ class LevelSelectScreen(Screen):
         first_btn_pos_x = (screen_width - btn_group_width) // 2
         first_btn_pos_y = 300
         for n in range(50):
-            self.all_level_buttons.add(LevelButton(n + 1, [first_btn_pos_x + round(horizontal_gap * (n % 10)),
-                                                           first_btn_pos_y + round(vertical_gap * (n // 10)),
-                                                           btn_width, btn_height], self))
+            self.all_level_buttons.append(LevelButton(n + 1, [first_btn_pos_x + round(horizontal_gap * (n % 10)),
+                                                              first_btn_pos_y + round(vertical_gap * (n // 10)),
+                                                              btn_width, btn_height], self))
 
         self.mainmenu_button = MainMenuButton(self)         # Button for going back to the main menu screen
 
@@ -915,18 +1028,18 @@ class HowToPlayScreen(Screen):
         Screen.__init__(self)
 
         self.title_text = Text("HOW TO PLAY", "verdana", 70, (screen_width // 2, screen_height // 6), "center")     # Text object
-        self.manage_list.append(self.title_text)            # Append this text to manage_list
+        self.add(self.title_text)                           # Add this text to this screen
 
         # Example images for explaining how to play
         img_size = (369, 235)
-        self.exp1_img = ImageView(example_game_img1, img_size, (150, 200))
-        self.exp2_img = ImageView(example_game_img2, img_size, (150, 400))
-        self.exp3_img = ImageView(example_game_img3, img_size, (150, 600))
-        self.exp4_img = ImageView(example_game_img4, img_size, (150, 800))
-        self.manage_list.append(self.exp1_img)
-        self.manage_list.append(self.exp2_img)
-        self.manage_list.append(self.exp3_img)
-        self.manage_list.append(self.exp4_img)
+        self.exp1_img = ImageView(example_game_img_path1, img_size, (150, 200))
+        self.exp2_img = ImageView(example_game_img_path2, img_size, (150, 400))
+        self.exp3_img = ImageView(example_game_img_path3, img_size, (150, 600))
+        self.exp4_img = ImageView(example_game_img_path4, img_size, (150, 800))
+        self.add(self.exp1_img)
+        self.add(self.exp2_img)
+        self.add(self.exp3_img)
+        self.add(self.exp4_img)
 
         # Description text box
         self.desc_textbox1 = TextGroupBox(text_list=["Welcome to Arc Tracker!!",
@@ -985,27 +1098,27 @@ class HowToPlayScreen(Screen):
                                           font="verdana",
                                           font_size=40,
                                           pos=(1200, 720))
-        self.manage_list.append(self.desc_textbox1)
-        self.manage_list.append(self.desc_textbox2)
-        self.manage_list.append(self.desc_textbox3)
-        self.manage_list.append(self.desc_textbox4)
-        self.manage_list.append(self.desc_textbox5)
-        self.manage_list.append(self.desc_textbox6)
-        self.manage_list.append(self.desc_textbox7)
-        self.manage_list.append(self.desc_textbox8)
-        self.manage_list.append(self.desc_textbox9)
+        self.add(self.desc_textbox1)
+        self.add(self.desc_textbox2)
+        self.add(self.desc_textbox3)
+        self.add(self.desc_textbox4)
+        self.add(self.desc_textbox5)
+        self.add(self.desc_textbox6)
+        self.add(self.desc_textbox7)
+        self.add(self.desc_textbox8)
+        self.add(self.desc_textbox9)
 
         self.mainmenu_button = MainMenuButton(self)         # Button for going back to the main menu screen
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw_background(self, surface: pygame.Surface) -> None:
         """
-        Overrides draw method from Screen class to draw an additional line
+        Overrides draw_background method from Screen class to draw an additional line
 
         :param surface: Surface to draw on
         :return: None
         """
 
-        Screen.draw(self, surface)
+        Screen.draw_background(self, surface)
 
         # Draw a vertical line to separate description texts
         pygame.draw.line(surface, WHITE1, (1130, 270), (1130, 1000), 2)
@@ -1026,7 +1139,7 @@ class SettingsScreen(Screen):
         Screen.__init__(self)
 
         self.title_text = Text("SETTINGS", "verdana", 70, (screen_width // 2, screen_height // 6), "center")     # Text object
-        self.manage_list.append(self.title_text)            # Append this text to manage_list
+        self.add(self.title_text)                           # Add this text to this screen
 
         self.mainmenu_button = MainMenuButton(self)         # Button for going back to the main menu screen
 
@@ -1054,9 +1167,14 @@ class GamePlayScreen(Screen):
         self.current_levelnum = 0
 
         self.popup_text_box = None
+        self.last_popup_rect = None     # Area of popup text box drawn in previous frame
 
         self.cleared_window = LevelClearedWindow(self)
 
+        # Everything that does not change until the level is initialized again (level number and static obstacles)
+        self.background = pygame.Surface((screen_width, screen_height)).convert()
+        self.full_redraw = True         # Whether background has to be rendered and whole screen has to be updated in next frame
+
     def intialize_level(self, levelnum: int) -> None:
         """
         Change and Initialize level to input levelnum parameter.
@@ -1066,64 +1184,113 @@ class GamePlayScreen(Screen):
         """
 
         self.manage_list.clear()
+        self.update_list.clear()
 
         self.current_levelnum = levelnum
         self.current_levelnum_text = Text(str(self.current_levelnum), "verdana", 400, (screen_width // 2, screen_height // 2), "center", WHITE3)
-        self.current_level = level_dict[self.current_levelnum]
+        self.current_level = get_level(self.current_levelnum)
         self.current_level.initialize()
-        self.manage_list.append(self.current_levelnum_text)
-        self.manage_list.append(self.current_level)
+        self.add(self.current_levelnum_text)
+        self.add(self.current_level)
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+        self.full_redraw = True
+
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Overrides update method of Screen class
 
         User can press "q" key to quit this level and return to LevelSelectScreen.
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
         Screen.update(self, mouse_state, key_state)
 
-        if key_state[pygame.K_q]:
+        if key_state[K_q]:
             self.current_level.initialize()
             self.hide()
             level_select_screen.show()
 
         # Generate popup if needed
-        if any([a.raise_popup for a in self.current_level.arctracker_group]):
+        if any(a.raise_popup for a in self.current_level.arctracker_tuple):
             self.popup_text_box = PopupTextBox("Rotation radius is too small!!")
-            self.manage_list.append(self.popup_text_box)
+            self.add(self.popup_text_box)
 
-            for a in self.current_level.arctracker_group:
+            for a in self.current_level.arctracker_tuple:
                 a.reject_path()
                 a.raise_popup = False
 
         # Delete popup object from manage list if it is killed
         if self.popup_text_box and not self.popup_text_box.alive():
             del self.manage_list[-1]
+            del self.update_list[-1]
             self.popup_text_box = None
 
         # If current level is cleared
         if self.current_level.cleared:
             self.cleared_window.update(mouse_state, key_state)
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
         """
         Draw all texts/buttons on this screen
 
+        Instead of clearing and drawing everything, only the areas of moving sprites in previous frame
+        are restored from the background, and then moving sprites are drawn on it.
+
         :param surface: Surface to draw on
-        :return: None
+        :return: Changed areas of screen, or None if whole screen has to be updated
         """
 
-        Screen.draw(self, surface)
+        # Screen hidden in this frame is replaced by the newly shown screen in next frame
+        if not self.now_display:
+            return []
+
+        level = self.current_level
+        full_update = self.full_redraw or level.cleared
+
+        # Render background once after the level is initialized
+        if self.full_redraw:
+            self.background.fill(BLACK)
+            self.current_levelnum_text.draw(self.background)
+            level.draw_static(self.background)
+            self.full_redraw = False
+
+        # Erase sprites of previous frame (whole screen is restored while translucent cleared window is on it)
+        if full_update:
+            surface.blit(self.background, (0, 0))
+        else:
+            restore_rects = level.last_drawn_rects.copy()
+            if self.last_popup_rect is not None:
+                restore_rects.append(self.last_popup_rect)
+            surface.blits([(self.background, r, r) for r in restore_rects], False)
+
+        level.draw_dynamic(surface)
+        if self.popup_text_box:
+            self.popup_text_box.draw(surface)
 
         # Draw cleared window if current level is cleared
-        if self.current_level.cleared:
+        if level.cleared:
             self.cleared_window.draw(surface)
 
+        # Only moving sprites of the level and popup text box change the screen
+        popup_rect = self.popup_text_box.rect.copy() if self.popup_text_box else None
+        dirty_rects = level.dirty_rects.copy()
+        if popup_rect is not None:
+            dirty_rects.append(popup_rect)
+        if self.last_popup_rect is not None:
+            dirty_rects.append(self.last_popup_rect)
+        self.last_popup_rect = popup_rect
+
+        # Updating many separate areas costs more than updating whole screen at once
+        if full_update or len(dirty_rects) >= self.max_dirty_rect_cnt:
+            return None
+
+        return dirty_rects
+
+
+active_screen = None                        # Screen which is displayed now (set by Screen.show)
 
 mainmenu_screen = MainMenuScreen()          # Generate MainMenuScreen class instance
 level_select_screen = LevelSelectScreen()   # Generate LevelSelectScreen class instance
@@ -6,9 +6,9 @@ import pygame.sprite
 import init
 from init import *
 import math
-from typing import Union, Dict, Sequence, Tuple, List
+from math import cos, sin     # Called every frame, so bound as module globals instead of looking up math module
+from typing import Union, Sequence, Tuple, List, Optional
 from typing import Callable
-import copy
 
 
 def distance(pos1: (Union[int, float], Union[int, float]),
@@ -20,7 +20,29 @@ def distance(pos1: (Union[int, float], Union[int, float]),
     :return: distance of the two positions
     """
 
-    return math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+    return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
+
+
+def distance_squared(pos1: (Union[int, float], Union[int, float]),
+                     pos2: (Union[int, float], Union[int, float])) -> Union[int, float]:
+    """
+    Returns squared distance of two positions with x, y coordinates
+
+    Use this instead of distance when the distance is only compared with a length (compare with squared length).
+    :param pos1: position 1
+    :param pos2: position 2
+    :return: squared distance of the two positions
+    """
+
+    dx = pos1[0] - pos2[0]
+    dy = pos1[1] - pos2[1]
+    return dx * dx + dy * dy
+
+
+# States of ArcTracker and ArcTrackerClone
+IDLE = 0        # Setting rotation axis
+READY = 1       # Rotation axis is fixed, waiting for direction input
+MOVING = 2      # Moving along its orbit
 
 
 class ArcTracker(pygame.sprite.Sprite):
@@ -55,24 +77,27 @@ class ArcTracker(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self)
 
         # Basic attributes
-        self.state = "idle"             # ["idle", "ready", "moving"]
+        self.state = IDLE               # [IDLE, READY, MOVING]
         self.initial_pos = pos          # Initial position
         self.x_pos, self.y_pos = pos    # Position on screen
         self.id_num = id_num            # ID number of ArcTracker
 
         self.size = (30, 30)                                                                # Size of ArcTracker
-        self.image = pygame.transform.scale(arc_tracker_img_list[id_num - 1], self.size)    # Image of ArcTracker
-        self.mask = pygame.mask.from_surface(self.image)                                    # Create a mask object for collision detection
+        self.image = scale_image(arc_tracker_img_list[id_num - 1], self.size)              # Image of ArcTracker
+        self.mask = get_mask(self.image)                                                    # Mask object for collision detection (shared)
         self.rect = self.image.get_rect(center=(self.x_pos, self.y_pos))                    # A virtual rectangle which encloses ArcTracker
 
         self.rotation_axis = (0, 0)         # Position of axis ArcTracker rotate around
         self.rotation_radius = 0            # Distance between ArcTracker's position and rotation axis
         self.rotation_speed = 360           # px/sec (NOT an angular speed)
         self.rotation_angular_speed = 0     # rad/sec
-        # Relative angular position of ArcTracker with respect to rotation axis measured from horizontal x axis
-        self.relative_angle = 0
         self.direction_factor = 1           # 1 for counterclockwise, -1 for clockwise
+        self.directed_angular_speed = 0     # rad/sec, signed by direction (computed once when direction is set)
         self.angular_speed_per_frame = 0
+        # Rotation angle of the latest frame in Moving state, and its cosine and sine
+        self.angle_step = 0
+        self.angle_step_cos = 1
+        self.angle_step_sin = 0
 
         # ArcTrackerPath class instance will be allocated if needed
         self.path = None
@@ -112,7 +137,7 @@ class ArcTracker(pygame.sprite.Sprite):
         if self.axis_marker:
             self.axis_marker.kill()
             self.axis_marker = None
-        self.state = "idle"
+        self.state = IDLE
         self.x_pos, self.y_pos = self.initial_pos
         self.rect.center = self.initial_pos
 
@@ -121,7 +146,7 @@ class ArcTracker(pygame.sprite.Sprite):
         self.raise_popup = False
         self.level_complete = False
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
@@ -131,32 +156,36 @@ class ArcTracker(pygame.sprite.Sprite):
         It is defined as an independent sprite class(ArcTrackerPath),
         and exists until moving process of ArcTracker finishes.
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
         # All operations of ArcTracker are available only before reaching goal point
         if not self.level_complete:
+            # Mouse button states are read only once
+            lclick = mouse_state.lclick
+            rclick = mouse_state.rclick
+
             # Angular speed will be nonzero only at Moving state
             self.angular_speed_per_frame = 0
 
             # At Idle state
-            if self.state == "idle":
+            if self.state == IDLE:
                 # Enters to axis setting mode when holding mouse left button
-                if not self.mouse_pressed and mouse_state[LCLICK]:
+                if not self.mouse_pressed and lclick:
                     self.mouse_pressed = True
-                    self.path = ArcTrackerPath(mouse_state[CURPOS], self.rect.center)                   # Generate ArcTrackerPath
+                    self.path = ArcTrackerPath(mouse_state.curpos, self.rect.center)                   # Generate ArcTrackerPath
                     self.borderline = MinimumRadiusBorderLine(self.rect.center, self.min_path_radius)   # Generate MinimumRadiusBorderLine
                     self.axis_marker = RotationAxisMarker(self)                                         # Generate RotationAxisMarker
 
                 # Set the position of rotation axis to current cursor position until mouse button is released
                 if self.mouse_pressed:
-                    self.rotation_axis = mouse_state[CURPOS]
+                    self.rotation_axis = mouse_state.curpos
 
                     # When releasing mouse left button
                     # And delete MinimumRadiusBorderLine
-                    if not mouse_state[LCLICK]:
+                    if not lclick:
                         self.borderline.kill()
                         self.borderline = None
                         self.axis_marker.kill()
@@ -168,7 +197,7 @@ class ArcTracker(pygame.sprite.Sprite):
 
                         # Change to Ready state and fix the rotation axis if radius of orbit is valid
                         if self.rotation_radius >= self.min_path_radius:
-                            self.state = "ready"
+                            self.state = READY
                         # Stay in Idle state and delete orbit if radius is invalid
                         else:
                             self.raise_popup = True
@@ -182,50 +211,59 @@ class ArcTracker(pygame.sprite.Sprite):
                     self.axis_marker.update(mouse_state, key_state)
 
             # At Ready state
-            elif self.state == "ready":
+            elif self.state == READY:
                 # Accepts only one input between left and right click
-                if not self.mouse_pressed and (mouse_state[LCLICK] ^ mouse_state[RCLICK]):
+                if not self.mouse_pressed and (lclick ^ rclick):
                     self.mouse_pressed = True
 
                     # Calculate all variables needed for rotation
                     self.rotation_radius = distance((self.x_pos, self.y_pos), self.rotation_axis)
                     self.rotation_angular_speed = self.rotation_speed / self.rotation_radius
-                    self.relative_angle = math.atan2(self.y_pos - self.rotation_axis[1], self.x_pos - self.rotation_axis[0])
-                    self.direction_factor = -1 if mouse_state[LCLICK] else 1    # Set rotation direction
+                    self.direction_factor = -1 if lclick else 1    # Set rotation direction
+                    self.directed_angular_speed = self.direction_factor * self.rotation_angular_speed
 
                 # Change to Moving state when releasing mouse button
-                if self.mouse_pressed and not (mouse_state[LCLICK] or mouse_state[RCLICK]):
+                if self.mouse_pressed and not (lclick or rclick):
                     self.mouse_pressed = False
-                    self.state = "Moving"
+                    self.state = MOVING
 
-                if (key_state[pygame.K_ESCAPE] or key_state[pygame.K_c]) and not (mouse_state[LCLICK] or mouse_state[RCLICK]):
+                if (key_state[K_ESCAPE] or key_state[K_c]) and not (lclick or rclick):
                     self.path.kill()
                     self.path = None
-                    self.state = "idle"
+                    self.state = IDLE
 
             # At Moving state
             else:
-                # Move ArcTracker
-                self.angular_speed_per_frame = self.direction_factor * self.rotation_angular_speed * init.DELTA_TIME
-                self.relative_angle += self.angular_speed_per_frame
-                self.x_pos = self.rotation_axis[0] + self.rotation_radius * math.cos(self.relative_angle)
-                self.y_pos = self.rotation_axis[1] + self.rotation_radius * math.sin(self.relative_angle)
+                # Move ArcTracker by rotating its offset from rotation axis by the angle of this frame
+                # (cosine and sine of that angle are computed again only when frame time changes)
+                angle_step = self.directed_angular_speed * init.DELTA_TIME
+                self.angular_speed_per_frame = angle_step
+                if angle_step != self.angle_step:
+                    self.angle_step = angle_step
+                    self.angle_step_cos = cos(angle_step)
+                    self.angle_step_sin = sin(angle_step)
+                step_cos, step_sin = self.angle_step_cos, self.angle_step_sin
+                axis_x, axis_y = self.rotation_axis
+                dx = self.x_pos - axis_x
+                dy = self.y_pos - axis_y
+                self.x_pos = axis_x + step_cos * dx - step_sin * dy
+                self.y_pos = axis_y + step_sin * dx + step_cos * dy
 
                 # Stop AcrTrakcer and delete its path if left mouse button pressed when moving
-                if not self.mouse_pressed and mouse_state[LCLICK]:
+                if not self.mouse_pressed and lclick:
                     self.rotation_angular_speed = 0
+                    self.directed_angular_speed = 0
                     self.mouse_pressed = True
                     self.path.kill()
                     self.path = None
 
                 # Return to Idle state if left mouse button released
-                if self.mouse_pressed and not mouse_state[LCLICK]:
+                if self.mouse_pressed and not lclick:
                     self.mouse_pressed = False
-                    self.state = "idle"
+                    self.state = IDLE
 
             # Update position of ArcTracker
-            self.rect.centerx = round(self.x_pos)
-            self.rect.centery = round(self.y_pos)
+            self.rect.center = (int(self.x_pos + 0.5), int(self.y_pos + 0.5))     # Rounded to the nearest pixel
 
         else:
             self.angular_speed_per_frame = 0
@@ -240,7 +278,7 @@ class ArcTracker(pygame.sprite.Sprite):
         if self.path:
             self.path.kill()
             self.path = None
-        self.state = "idle"
+        self.state = IDLE
 
 
 class ArcTrackerClone(pygame.sprite.Sprite):
@@ -265,7 +303,7 @@ class ArcTrackerClone(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self)
 
         # Basic attributes
-        self.state = "idle"             # ["idle", "ready", "moving"]
+        self.state = IDLE               # [IDLE, READY, MOVING]
         self.initial_pos = pos          # Initial position
         self.x_pos, self.y_pos = pos    # Position on screen
         self.id_num = id_num            # ID number of ArcTrackerClone
@@ -275,20 +313,23 @@ class ArcTrackerClone(pygame.sprite.Sprite):
         self.size = (30, 30)                                                                # Size of ArcTrackerClone
         # Image of ArcTrackerClone
         if not move_opposite_direction:
-            self.image = pygame.transform.scale(arc_tracker_clone_img_list[id_num - 1], self.size)
+            self.image = scale_image(arc_tracker_clone_img_list[id_num - 1], self.size)
         else:
-            self.image = pygame.transform.scale(arc_tracker_counter_clone_img_list[id_num - 1], self.size)
-        self.mask = pygame.mask.from_surface(self.image)                                    # Create a mask object for collision detection
+            self.image = scale_image(arc_tracker_counter_clone_img_list[id_num - 1], self.size)
+        self.mask = get_mask(self.image)                                                    # Mask object for collision detection (shared)
         self.rect = self.image.get_rect(center=(self.x_pos, self.y_pos))                    # A virtual rectangle which encloses ArcTrackerClone
 
         self.rotation_axis = (0, 0)         # Position of axis ArcTrackerClone rotate around
         self.rotation_radius = 0            # Distance between ArcTrackerClone's position and rotation axis
         self.rotation_speed = 360           # px/sec (NOT an angular speed)
         self.rotation_angular_speed = 0     # rad/sec
-        # Relative angular position of ArcTrackerClone with respect to rotation axis measured from horizontal x axis
-        self.relative_angle = 0
         self.direction_factor = 1           # 1 for counterclockwise, -1 for clockwise
+        self.directed_angular_speed = 0     # rad/sec, signed by direction (computed once when direction is set)
         self.angular_speed_per_frame = 0
+        # Rotation angle of the latest frame in Moving state, and its cosine and sine
+        self.angle_step = 0
+        self.angle_step_cos = 1
+        self.angle_step_sin = 0
 
         # ArcTrackerPath class instance will be allocated if needed
         self.path = None
@@ -303,6 +344,9 @@ class ArcTrackerClone(pygame.sprite.Sprite):
         # To indicate whether mouse button is pressed
         self.mouse_pressed = False
 
+        # Mouse state passed to path and axis marker of ArcTrackerClone (cursor moved to its own rotation axis)
+        self.axis_mouse_state = MouseState()
+
         # A reference to determine raise popup
         self.raise_popup = False
 
@@ -339,7 +383,7 @@ class ArcTrackerClone(pygame.sprite.Sprite):
         if self.axis_marker:
             self.axis_marker.kill()
             self.axis_marker = None
-        self.state = "idle"
+        self.state = IDLE
         self.x_pos, self.y_pos = self.initial_pos
         self.rect.center = self.initial_pos
 
@@ -348,28 +392,32 @@ class ArcTrackerClone(pygame.sprite.Sprite):
         self.raise_popup = False
         self.level_complete = False
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
         # All operations of ArcTrackerClone are available only before reaching goal point
         if not self.level_complete:
+            # Mouse button states are read only once
+            lclick = mouse_state.lclick
+            rclick = mouse_state.rclick
+
             # Angular speed will be nonzero only at Moving state
             self.angular_speed_per_frame = 0
 
             # At Idle state
-            if self.state == "idle":
+            if self.state == IDLE:
                 # Enters to axis setting mode when holding mouse left button
-                if not self.mouse_pressed and mouse_state[LCLICK]:
+                if not self.mouse_pressed and lclick:
                     self.mouse_pressed = True
 
-                    self.relative_axis_x = mouse_state[CURPOS][0] - self.host.rect.centerx
-                    self.relative_axis_y = mouse_state[CURPOS][1] - self.host.rect.centery
+                    self.relative_axis_x = mouse_state.curpos[0] - self.host.rect.centerx
+                    self.relative_axis_y = mouse_state.curpos[1] - self.host.rect.centery
                     self.new_axis = (self.rect.centerx + self.relative_axis_x,
                                      self.rect.centerx + self.relative_axis_y)
 
@@ -383,7 +431,7 @@ class ArcTrackerClone(pygame.sprite.Sprite):
 
                     # When releasing mouse left button
                     # And delete MinimumRadiusBorderLine
-                    if not mouse_state[LCLICK]:
+                    if not lclick:
                         self.borderline.kill()
                         self.borderline = None
                         self.axis_marker.kill()
@@ -395,20 +443,24 @@ class ArcTrackerClone(pygame.sprite.Sprite):
 
                         # Change to Ready state and fix the rotation axis if radius of orbit is valid
                         if self.rotation_radius >= self.min_path_radius:
-                            self.state = "ready"
+                            self.state = READY
                         # Stay in Idle state and delete orbit if radius is invalid
                         else:
                             self.raise_popup = True
                             self.reject_path()
 
                 # Calculate current position of rotation axis of ArcTrackerClone
-                new_mouse_state = copy.deepcopy(mouse_state)
-
-                self.relative_axis_x = mouse_state[CURPOS][0] - self.host.rect.centerx
-                self.relative_axis_y = mouse_state[CURPOS][1] - self.host.rect.centery
+                new_mouse_state = self.axis_mouse_state
+                new_mouse_state.lclick, new_mouse_state.mclick, new_mouse_state.rclick = lclick, mouse_state.mclick, rclick
+                new_mouse_state.scrlup, new_mouse_state.scrldn = mouse_state.scrlup, mouse_state.scrldn
+
+                cursor_x, cursor_y = mouse_state.curpos
+                host_x, host_y = self.host.rect.center
+                self.relative_axis_x = cursor_x - host_x
+                self.relative_axis_y = cursor_y - host_y
                 self.new_axis = (self.rect.centerx + self.relative_axis_x,
                                  self.rect.centery + self.relative_axis_y)
-                new_mouse_state[CURPOS] = self.new_axis
+                new_mouse_state.curpos = self.new_axis
 
                 # Update path of ArcTrackerClone only at Idle state
                 if self.path:
@@ -418,55 +470,64 @@ class ArcTrackerClone(pygame.sprite.Sprite):
                     self.axis_marker.update(new_mouse_state, key_state)
 
             # At Ready state
-            elif self.state == "ready":
+            elif self.state == READY:
                 # Accepts only one input between left and right click
-                if not self.mouse_pressed and (mouse_state[LCLICK] ^ mouse_state[RCLICK]):
+                if not self.mouse_pressed and (lclick ^ rclick):
                     self.mouse_pressed = True
 
                     # Calculate all variables needed for rotation
                     self.rotation_radius = distance((self.x_pos, self.y_pos), self.rotation_axis)
                     self.rotation_angular_speed = self.rotation_speed / self.rotation_radius
-                    self.relative_angle = math.atan2(self.y_pos - self.rotation_axis[1], self.x_pos - self.rotation_axis[0])
 
                     # Set rotation direction of ArcTrackerClone
                     if not self.move_opposite_direction:
-                        self.direction_factor = -1 if mouse_state[LCLICK] else 1
+                        self.direction_factor = -1 if lclick else 1
                     else:
-                        self.direction_factor = 1 if mouse_state[LCLICK] else -1
+                        self.direction_factor = 1 if lclick else -1
+                    self.directed_angular_speed = self.direction_factor * self.rotation_angular_speed
 
                 # Change to Moving state when releasing mouse button
-                if self.mouse_pressed and not (mouse_state[LCLICK] or mouse_state[RCLICK]):
+                if self.mouse_pressed and not (lclick or rclick):
                     self.mouse_pressed = False
-                    self.state = "Moving"
+                    self.state = MOVING
 
-                if (key_state[pygame.K_ESCAPE] or key_state[pygame.K_c]) and not (mouse_state[LCLICK] or mouse_state[RCLICK]):
+                if (key_state[K_ESCAPE] or key_state[K_c]) and not (lclick or rclick):
                     self.path.kill()
                     self.path = None
-                    self.state = "idle"
+                    self.state = IDLE
 
             # At Moving state
             else:
-                # Move ArcTrackerClone
-                self.angular_speed_per_frame = self.direction_factor * self.rotation_angular_speed * init.DELTA_TIME
-                self.relative_angle += self.angular_speed_per_frame
-                self.x_pos = self.rotation_axis[0] + self.rotation_radius * math.cos(self.relative_angle)
-                self.y_pos = self.rotation_axis[1] + self.rotation_radius * math.sin(self.relative_angle)
+                # Move ArcTrackerClone by rotating its offset from rotation axis by the angle of this frame
+                # (cosine and sine of that angle are computed again only when frame time changes)
+                angle_step = self.directed_angular_speed * init.DELTA_TIME
+                self.angular_speed_per_frame = angle_step
+                if angle_step != self.angle_step:
+                    self.angle_step = angle_step
+                    self.angle_step_cos = cos(angle_step)
+                    self.angle_step_sin = sin(angle_step)
+                step_cos, step_sin = self.angle_step_cos, self.angle_step_sin
+                axis_x, axis_y = self.rotation_axis
+                dx = self.x_pos - axis_x
+                dy = self.y_pos - axis_y
+                self.x_pos = axis_x + step_cos * dx - step_sin * dy
+                self.y_pos = axis_y + step_sin * dx + step_cos * dy
 
                 # Stop ArcTrackerClone and delete its path if left mouse button pressed when moving
-                if not self.mouse_pressed and mouse_state[LCLICK]:
+                if not self.mouse_pressed and lclick:
                     self.rotation_angular_speed = 0
+                    self.directed_angular_speed = 0
                     self.mouse_pressed = True
                     self.path.kill()
                     self.path = None
 
                 # Return to Idle state if left mouse button released
-                if self.mouse_pressed and not mouse_state[LCLICK]:
+                if self.mouse_pressed and not lclick:
                     self.mouse_pressed = False
-                    self.state = "idle"
+                    self.state = IDLE
 
             # Update position of ArcTrackerClone
-            self.rect.centerx = round(self.x_pos)
-            self.rect.centery = round(self.y_pos)
+            self.rect.center = (int(self.x_pos + 0.5), int(self.y_pos + 0.5))     # Rounded to the nearest pixel
 
         else:
             self.angular_speed_per_frame = 0
@@ -481,7 +542,7 @@ class ArcTrackerClone(pygame.sprite.Sprite):
         if self.path:
             self.path.kill()
             self.path = None
-        self.state = "idle"
+        self.state = IDLE
 
 
 class ArcTrackerPath(pygame.sprite.Sprite):
@@ -504,36 +565,43 @@ class ArcTrackerPath(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self)
 
         self.x_pos, self.y_pos = cursor_pos                         # Center position of circular path
-        self.arc_tracker_pos = arc_tracker_pos                      # Position of ArcTracker which will follow this path
-        self.radius = distance(cursor_pos, self.arc_tracker_pos)    # Radius of circular path
+        # Position of ArcTracker which will follow this path (a vector, so that distance is measured in a single C call)
+        self.arc_tracker_pos = pygame.math.Vector2(arc_tracker_pos)
+        self.radius = self.arc_tracker_pos.distance_to(cursor_pos)  # Radius of circular path
 
         self.image = pygame.Surface((2 * self.radius, 2 * self.radius))     # Create a new surface object to draw circle on
         self.image.set_colorkey(BLACK)                                      # Initially make it fully transparent
         self.rect = self.image.get_rect(center=cursor_pos)                  # A virtual rectangle which encloses ArcTrackerPath
         # Draw a circle path on this surface
         pygame.draw.circle(self.image, WHITE2, (self.radius, self.radius), self.radius, 2)
+        self.image_key = (int(2 * self.radius), int(self.radius))          # Pixel size and radius which current image is drawn with
 
         # Add this sprite to sprite groups
         self.group.add(self)
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
-        self.x_pos, self.y_pos = mouse_state[CURPOS]                        # Update center position of circular path
-        self.radius = distance(mouse_state[CURPOS], self.arc_tracker_pos)   # Update radius of circular path
+        curpos = mouse_state.curpos
+        self.x_pos, self.y_pos = curpos                                     # Update center position of circular path
+        self.radius = self.arc_tracker_pos.distance_to(curpos)              # Update radius of circular path
 
-        # Redefine surface using updated position and radius
-        self.image = pygame.Surface((2 * self.radius, 2 * self.radius))     # Create a new surface object to draw circle on
-        self.image.set_colorkey(BLACK)                                      # Initially make it fully transparent
-        self.rect = self.image.get_rect(center=mouse_state[CURPOS])         # A virtual rectangle which encloses ArcTrackerPath
-        # Draw a circle path on this surface
-        pygame.draw.circle(self.image, WHITE2, (self.radius, self.radius), self.radius, 2)
+        # Surface size and circle are drawn in whole pixels, so surface is redefined only when they change
+        image_key = (int(2 * self.radius), int(self.radius))
+        if image_key != self.image_key:
+            self.image_key = image_key
+            self.image = pygame.Surface((2 * self.radius, 2 * self.radius))     # Create a new surface object to draw circle on
+            self.image.set_colorkey(BLACK)                                      # Initially make it fully transparent
+            self.rect = self.image.get_rect()                                   # A virtual rectangle which encloses ArcTrackerPath
+            # Draw a circle path on this surface
+            pygame.draw.circle(self.image, WHITE2, (self.radius, self.radius), self.radius, 2)
+        self.rect.center = curpos
 
 
 class MinimumRadiusBorderLine(pygame.sprite.Sprite):
@@ -558,19 +626,19 @@ class MinimumRadiusBorderLine(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self)
 
         self.image = pygame.Surface((2 * radius, 2 * radius))   # Create a new surface object to draw circle on
-        self.image.set_colorkey(BLACK)                          # Initially make it fully transparent
         self.rect = self.image.get_rect(center=center)          # A virtual rectangle which encloses MinimumRadiusBorderLine
         # Draw a circle border line on this surface
         pygame.draw.circle(self.image, RED1, (radius, radius), radius, 2)
+        self.image.set_colorkey(BLACK, RLEACCEL)                # Make it transparent except the line (run-length encoded after drawing)
 
         # Add this sprite to sprite groups
         self.group.add(self)
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
@@ -598,30 +666,30 @@ class RotationAxisMarker(pygame.sprite.Sprite):
         self.at = arc_tracker       # ArcTracker which this marker belongs to
 
         # Determine current image according to whether cursor position is out of borderline
-        self.image_list = [axis_marker_O_img, axis_marker_X_img]
-        if distance(mouse[CURPOS], self.at.rect.center) >= self.at.min_path_radius:
+        self.image_list = axis_marker_img_list
+        if distance_squared(mouse.curpos, self.at.rect.center) >= self.at.min_path_radius ** 2:
             self.image = self.image_list[0]
         else:
             self.image = self.image_list[1]
-        self.rect = self.image.get_rect(center=mouse[CURPOS])
+        self.rect = self.image.get_rect(center=mouse.curpos)
 
         # Add this sprite to sprite groups
         self.group.add(self)
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
-        self.rect.center = mouse_state[CURPOS]      # Update position
+        curpos = mouse_state.curpos
+        self.rect.center = curpos      # Update position
 
         # Update current image according to whether cursor position is out of borderline
-        self.image_list = [axis_marker_O_img, axis_marker_X_img]
-        if distance(mouse_state[CURPOS], self.at.rect.center) >= self.at.min_path_radius:
+        if distance_squared(curpos, self.at.rect.center) >= self.at.min_path_radius ** 2:
             self.image = self.image_list[0]
         else:
             self.image = self.image_list[1]
@@ -659,11 +727,11 @@ class Coin(pygame.sprite.Sprite):
         :return: None
         """
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
@@ -703,13 +771,13 @@ class GoalPoint(pygame.sprite.Sprite):
 
         self.arctracker_matched = False
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
         Switch image at every frame to display animating effect of GoalPoint
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
@@ -725,6 +793,8 @@ class Obstacle(pygame.sprite.Sprite):
     A normal, non-moving obstacle class
     """
 
+    is_static = True    # Whether this obstacle never moves (moving obstacle classes must override this to False)
+
     def __init__(self):
         """
         Initializing method
@@ -739,11 +809,11 @@ class Obstacle(pygame.sprite.Sprite):
         :return: None
         """
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
@@ -765,6 +835,7 @@ class StaticRectangularObstacle(Obstacle):
     """
 
     group = pygame.sprite.Group()  # StaticRectangularObstacle' own sprite group
+    surface_cache = {}             # Image and mask shared by obstacles of the same size (keys: (w, h), values: (image, mask))
 
     def __init__(self, x: int, y: int, w: int, h: int):
         """
@@ -778,14 +849,42 @@ class StaticRectangularObstacle(Obstacle):
 
         Obstacle.__init__(self)
 
-        self.image = pygame.Surface((w, h))                 # Create a new rectangular surface object
-        self.image.fill(WHITE1)                             # Fill in this surface with white
-        self.mask = pygame.mask.from_surface(self.image)    # Create a mask object for collision detection
+        # Cache is referred through the class, since StaticInnerCurvedObstacle also runs this method
+        surface_cache = StaticRectangularObstacle.surface_cache
+        if (w, h) not in surface_cache:
+            image = pygame.Surface((w, h))                  # Create a new rectangular surface object
+            image.fill(WHITE1)                              # Fill in this surface with white
+            surface_cache[(w, h)] = (image, pygame.mask.from_surface(image))
+
+        self.image, self.mask = surface_cache[(w, h)]       # Mask object is used for collision detection
         self.rect = self.image.get_rect(topleft=(x, y))     # A virtual rectangle which encloses StaticRectangularObstacle
 
         # Add this sprite to sprite groups
         self.group.add(self)
 
+    def collided(self, sprite: pygame.sprite.Sprite) -> bool:
+        """
+        Check collision with given sprite
+
+        Given sprite is regarded as a circle. The closest point of this rectangle to the center of the circle
+        is found by clamping the center into this rectangle, so this method does not use mask object.
+        Rects of both sprites must overlap as well, like pixels of their masks do.
+
+        :param sprite: Sprite to check collision
+        :return: bool
+        """
+
+        rect = self.rect
+        if not rect.colliderect(sprite.rect):
+            return False
+
+        center_x, center_y = sprite.rect.center
+        radius = sprite.rect.w // 2
+
+        dx = center_x - min(max(center_x, rect.left), rect.right - 1)
+        dy = center_y - min(max(center_y, rect.top), rect.bottom - 1)
+        return dx * dx + dy * dy <= radius * radius
+
 
 class StaticCircularObstacle(Obstacle):
     """
@@ -793,6 +892,7 @@ class StaticCircularObstacle(Obstacle):
     """
 
     group = pygame.sprite.Group()  # StaticCircularObstacle' own sprite group
+    surface_cache = {}             # Image and mask shared by obstacles of the same radius (keys: radius, values: (image, mask))
 
     def __init__(self, x: int, y: int, r: int):
         """
@@ -805,10 +905,15 @@ class StaticCircularObstacle(Obstacle):
 
         Obstacle.__init__(self)
 
-        self.image = pygame.Surface((2 * r, 2 * r))         # Create a new rectangular surface object
-        self.image.set_colorkey(BLACK)                      # Initially make it fully transparent
-        pygame.draw.circle(self.image, WHITE1, (r, r), r)   # Draw a circle in this surface
-        self.mask = pygame.mask.from_surface(self.image)    # Create a mask object for collision detection
+        # Cache is referred through the class, since StaticInnerCurvedObstacle also runs this method
+        surface_cache = StaticCircularObstacle.surface_cache
+        if r not in surface_cache:
+            image = pygame.Surface((2 * r, 2 * r))          # Create a new rectangular surface object
+            image.set_colorkey(BLACK)                       # Initially make it fully transparent
+            pygame.draw.circle(image, WHITE1, (r, r), r)    # Draw a circle in this surface
+            surface_cache[r] = (image, pygame.mask.from_surface(image))
+
+        self.image, self.mask = surface_cache[r]            # Mask object is used for collision detection
         self.rect = self.image.get_rect(center=(x, y))      # A virtual rectangle which encloses StaticCircularObstacle
         self.radius = r                                     # Used for collision detection
 
@@ -826,7 +931,7 @@ class StaticCircularObstacle(Obstacle):
         :return: bool
         """
 
-        return distance(self.rect.center, sprite.rect.center) < self.radius + sprite.rect.w // 2
+        return distance_squared(self.rect.center, sprite.rect.center) < (self.radius + sprite.rect.w // 2) ** 2
 
 
 class StaticPolygonObstacle(Obstacle):
@@ -931,6 +1036,8 @@ class StaticInnerCurvedObstacle(Obstacle):
         original_obstacle_class.__init__(self, *params)
 
         # Cut off this obstacle in arc shape by drawing transparent circle
+        # (on its own copy of image, since original obstacle class may share its image with other obstacles)
+        self.image = self.image.copy()
         relative_centerx = inner_curve_center[0] - self.rect.x
         relative_centery = inner_curve_center[1] - self.rect.y
         pygame.draw.circle(self.image, BLACK, (relative_centerx, relative_centery), inner_curve_radius)
@@ -1186,6 +1293,7 @@ class RotatingRectangularObstacle(Obstacle):
     """
 
     group = pygame.sprite.Group()   # RotatingRectangularObstacle' own sprite group
+    is_static = False
 
     def __init__(self, size: (int, int), rotation_axis: (int, int), angular_speed: Union[int, float], initial_angle=0, center_offset=(0, 0)):
         """
@@ -1213,6 +1321,7 @@ class RotatingRectangularObstacle(Obstacle):
 
         self.image_orig = self.rect_image                   # Used for rotating
         self.image = pygame.transform.rotate(self.image_orig, initial_angle)    # Make image using initial angle
+        self.image_angle = None                             # Whole-degree angle which current image is rotated by
         self.image.set_colorkey(BLACK)                      # Make black background fully transparent
         self.mask = pygame.mask.from_surface(self.image)    # Create a mask object for collision detection
         # A virtual rectangle which encloses RotatingRectangularObstacle
@@ -1230,21 +1339,27 @@ class RotatingRectangularObstacle(Obstacle):
 
         self.current_angle = self.initial_angle     # Reset angle to initial value
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
         self.current_angle += self.angular_speed * init.DELTA_TIME
-        self.image = pygame.transform.rotate(self.image_orig, self.current_angle - self.offset_angle)
-        self.image.set_colorkey(BLACK)
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = self.image.get_rect(center=(self.rotation_axis[0] + self.rotation_radius * math.cos(self.current_angle * math.pi / 180),
-                                                self.rotation_axis[1] - self.rotation_radius * math.sin(self.current_angle * math.pi / 180)))
+
+        # Rotate image (and create its mask) only when its angle changes by a whole degree
+        image_angle = round(self.current_angle - self.offset_angle) % 360
+        if image_angle != self.image_angle:
+            self.image_angle = image_angle
+            self.image = pygame.transform.rotate(self.image_orig, image_angle)
+            self.image.set_colorkey(BLACK)
+            self.mask = pygame.mask.from_surface(self.image)
+        current_angle_rad = self.current_angle * math.pi / 180
+        self.rect = self.image.get_rect(center=(self.rotation_axis[0] + self.rotation_radius * cos(current_angle_rad),
+                                                self.rotation_axis[1] - self.rotation_radius * sin(current_angle_rad)))
 
 
 class RotatingImageObstacle(Obstacle):
@@ -1253,6 +1368,7 @@ class RotatingImageObstacle(Obstacle):
     """
 
     group = pygame.sprite.Group()   # RotatingImageObstacle' own sprite group
+    is_static = False
 
     def __init__(self, image: pygame.Surface, axis_pos: (int, int), rotation_speed: float):
         """
@@ -1274,6 +1390,7 @@ class RotatingImageObstacle(Obstacle):
 
         self.rotation_speed = rotation_speed    # Angular speed of rotation in degrees/sec
         self.current_angle = 0
+        self.image_angle = 0                    # Whole-degree angle which current image is rotated by
 
         # Add this sprite to sprite groups
         self.group.add(self)
@@ -1287,20 +1404,25 @@ class RotatingImageObstacle(Obstacle):
 
         self.current_angle = 0      # Reset angle to 0
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
         self.current_angle += self.rotation_speed * init.DELTA_TIME          # Update angle
-        self.image = pygame.transform.rotate(self.image_orig, self.current_angle)
-        self.image.set_colorkey(BLACK)
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = self.image.get_rect(center=self.center_orig)
+
+        # Rotate image (and create its mask) only when its angle changes by a whole degree
+        image_angle = round(self.current_angle) % 360
+        if image_angle != self.image_angle:
+            self.image_angle = image_angle
+            self.image = pygame.transform.rotate(self.image_orig, image_angle)
+            self.image.set_colorkey(BLACK)
+            self.mask = pygame.mask.from_surface(self.image)
+            self.rect = self.image.get_rect(center=self.center_orig)
 
 
 class AngleFollowerRectangularObstacle(Obstacle):
@@ -1320,6 +1442,7 @@ class AngleFollowerImageObstacle(Obstacle):
     """
 
     group = pygame.sprite.Group()   # AngleFollowerImageObstacle' own sprite group
+    is_static = False
 
     def __init__(self, image: pygame.Surface, axis_pos: (int, int), at_index=0):
         """
@@ -1340,12 +1463,10 @@ class AngleFollowerImageObstacle(Obstacle):
         self.center_orig = axis_pos                         # For preserving rotation axis
 
         self.current_angle = 0
+        self.image_angle = 0                                # Whole-degree angle which current image is rotated by
         self.at_index = at_index
         self.following_at = None                            # ArcTracker to follow rotation angle (will be assigned at level class initialization)
 
-        self.current_at_angle = self.last_at_angle = 0
-        self.angle_diff = (self.current_at_angle - self.last_at_angle) * 180 / math.pi
-
         # Add this sprite to sprite groups
         self.group.add(self)
 
@@ -1357,7 +1478,6 @@ class AngleFollowerImageObstacle(Obstacle):
         """
 
         self.following_at = arctracker
-        self.current_at_angle = self.last_at_angle = self.following_at.relative_angle
 
     def initialize(self) -> None:
         """
@@ -1368,22 +1488,23 @@ class AngleFollowerImageObstacle(Obstacle):
 
         self.current_angle = 0      # Reset angle to 0
 
-    def update(self, mouse_state: Dict[int, Union[bool, Tuple[int, int]]], key_state: Sequence[bool]) -> None:
+    def update(self, mouse_state: MouseState, key_state: Sequence[bool]) -> None:
         """
         Updating method needed for all sprite class
 
-        :param mouse_state: Dictionary of clicking event and position info
+        :param mouse_state: Clicking event and position info of mouse
         :param key_state: Dictionary of event from pressing keyboard
         :return: None
         """
 
         # Update angle
         self.current_angle -= self.following_at.angular_speed_per_frame * 180 / math.pi
-        self.last_at_angle = self.current_at_angle
-        self.current_at_angle = self.following_at.relative_angle
 
-        # Update image according to current angle
-        self.image = pygame.transform.rotate(self.image_orig, self.current_angle)
-        self.image.set_colorkey(BLACK)
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = self.image.get_rect(center=self.center_orig)
+        # Update image according to current angle (only when it changes by a whole degree)
+        image_angle = round(self.current_angle) % 360
+        if image_angle != self.image_angle:
+            self.image_angle = image_angle
+            self.image = pygame.transform.rotate(self.image_orig, image_angle)
+            self.image.set_colorkey(BLACK)
+            self.mask = pygame.mask.from_surface(self.image)
+            self.rect = self.image.get_rect(center=self.center_orig)